@@ -13,35 +13,56 @@ Date: August 24, 2025
 import time
 import subprocess
 import os
+import shutil
+import sys
 import json
-import statistics
 import csv
-from typing import Dict, List, Tuple, Any, Optional
-from dataclasses import dataclass, asdict
+import functools
+import io
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple, Any, Optional
+from dataclasses import dataclass, asdict, fields
+from hashlib import blake2b
 from pathlib import Path
 
-# Optional imports for visualization (will work without them)
+from jinja2 import Environment, FileSystemLoader
+
+# orjson serializes dataclasses in C; fall back to the stdlib if it is missing
 try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+@functools.lru_cache(maxsize=None)
+def _viz():
+    """Import the optional visualization stack on first use.
+
+    Generating and compiling test cases needs none of these packages, so they
+    are only loaded by the plotting/reporting code. Raises ImportError when
+    they are not installed.
+    """
     import matplotlib.pyplot as plt
     import numpy as np
     import pandas as pd
-    HAS_VISUALIZATION = True
-except ImportError:
-    HAS_VISUALIZATION = False
-    print("Note: Visualization packages not available. Continuing without plots.")
+    return plt, np, pd
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BenchmarkResult:
     """Represents the result of a single benchmark run."""
     name: str
-    compilation_time: float  # seconds
+    compilation_time_ns: int  # compile step wall clock, nanoseconds
+    link_time_ns: int  # link step wall clock, nanoseconds
+    compiler_cpu_time_ns: int  # compiler + linker user/system CPU, nanoseconds
     binary_size: int  # bytes
     runtime_performance: float  # operations per second
     memory_usage: int  # bytes
     error_count: int
     warning_count: int
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComparisonResult:
     """Represents comparison between reflection and traditional approaches."""
     test_case: str
@@ -52,6 +73,127 @@ class ComparisonResult:
     size_ratio: float
     memory_ratio: float
 
+# Record layout of a BenchmarkResult inside the shared-memory results buffer
+RESULT_FIELDS = [
+    ("name", "S64"),
+    ("compilation_time_ns", "i8"),
+    ("link_time_ns", "i8"),
+    ("compiler_cpu_time_ns", "i8"),
+    ("binary_size", "i8"),
+    ("runtime_performance", "f8"),
+    ("memory_usage", "i8"),
+    ("error_count", "i4"),
+    ("warning_count", "i4"),
+]
+
+@functools.lru_cache(maxsize=None)
+def _resolve_tool(tool: str) -> str:
+    """Absolute path of a tool, or the bare name if it is not on PATH."""
+    return shutil.which(tool) or tool
+
+def _timed_run(cmd: List[str], env: Dict[str, str]) -> Tuple[int, str, int]:
+    """Run one tool invocation; returns (returncode, stderr, wall clock ns)."""
+    # An absolute executable plus close_fds=False lets subprocess launch via
+    # posix_spawn instead of fork+exec, so the worker's page tables (numpy,
+    # pandas) are not copied for every compiler invocation. Descriptors
+    # Python opens are non-inheritable anyway, so nothing leaks.
+    cmd = [_resolve_tool(cmd[0]), *cmd[1:]]
+    # perf_counter_ns is monotonic, so NTP adjustments cannot skew long runs
+    start_ns = time.perf_counter_ns()
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, env=env,
+                                close_fds=False)
+        returncode, stderr = result.returncode, result.stderr
+    except OSError as e:
+        returncode, stderr = -1, f"error: {e}"
+    return returncode, stderr, time.perf_counter_ns() - start_ns
+
+def _run_compile_job(shm_name: str, n_jobs: int, index: int, name: str,
+                     compile_cmd: List[str], link_cmd: List[str],
+                     env: Dict[str, str], output: Path):
+    """Compile and link one benchmark and store its result in row `index`.
+
+    Lives at module level so it can be pickled into ProcessPoolExecutor
+    workers. The row is written straight into the parent's shared-memory
+    buffer, so nothing but the completion signal travels back through pickle.
+    """
+    import numpy as np
+
+    # os.times() splits out the CPU the compiler and linker themselves consumed
+    cpu_before = os.times()
+    returncode, stderr, compilation_time_ns = _timed_run(compile_cmd, env)
+    link_time_ns = 0
+    if returncode == 0:
+        returncode, link_stderr, link_time_ns = _timed_run(link_cmd, env)
+        stderr += link_stderr
+    cpu_after = os.times()
+    compiler_cpu_time_ns = round(
+        (cpu_after.children_user - cpu_before.children_user
+         + cpu_after.children_system - cpu_before.children_system) * 1e9
+    )
+
+    error_count = stderr.count("error:")
+    if returncode != 0:
+        error_count = max(error_count, 1)
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    rows = None
+    try:
+        rows = np.ndarray((n_jobs,), dtype=np.dtype(RESULT_FIELDS), buffer=shm.buf)
+        rows[index] = (
+            name.encode()[:64],
+            compilation_time_ns,
+            link_time_ns,
+            compiler_cpu_time_ns,
+            output.stat().st_size if returncode == 0 and output.exists() else 0,
+            0.0,  # runtime_performance, filled in by the runtime phase
+            0,
+            error_count,
+            stderr.count("warning:"),
+        )
+    finally:
+        # Release the view first, as in compile_all, so a failed row write
+        # is not masked by BufferError from close()
+        del rows
+        shm.close()
+
+def _summarize_times(times) -> Dict[str, float]:
+    """Summarize an array of timings in seconds (median, mean, std, tails)."""
+    import numpy as np
+
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    return {
+        "median": float(p50),
+        "mean": float(times.mean()),
+        "std": float(times.std()),
+        "p95": float(p95),
+        "p99": float(p99)
+    }
+
+def _interned(*args: str) -> Tuple[str, ...]:
+    """Return the arguments as a tuple of interned strings."""
+    return tuple(sys.intern(arg) for arg in args)
+
+# Benchmark manifest. Each entry is rendered once per variant from
+# templates/<name>_<variant>.cpp.j2; both variants of a pair share the same
+# iteration count so their results stay comparable.
+BENCHMARKS = [
+    {"name": "serialization", "title": "Basic Serialization", "iterations": 100000},
+    {"name": "orm", "title": "ORM/Database Mapping", "iterations": 50000},
+    {"name": "binding", "title": "Property Binding", "iterations": 25000},
+    {"name": "pattern", "title": "Design Pattern Generation", "iterations": 10000},
+    {"name": "template", "title": "Complex Template Hierarchies", "iterations": 50000},
+]
+VARIANTS = ("reflection", "traditional")
+
+@functools.lru_cache(maxsize=None)
+def _template_env() -> Environment:
+    """Shared Jinja2 environment for the benchmark source templates."""
+    return Environment(
+        loader=FileSystemLoader(Path(__file__).parent / "templates"),
+        keep_trailing_newline=True
+    )
+
 class CPPBenchmarkFramework:
     """Framework for running C++ compilation and runtime benchmarks."""
     
@@ -61,979 +203,246 @@ class CPPBenchmarkFramework:
         self.results_dir = self.project_root / "results"
         self.results_dir.mkdir(exist_ok=True)
         
-        # Compiler configurations
+        # Route compiles through ccache when available so unchanged sources
+        # are served from the cache on repeated runs
+        launcher = ("ccache",) if shutil.which("ccache") else ()
+        self.compile_env = os.environ | {
+            "CCACHE_DIR": str(self.results_dir / "ccache"),
+            "CCACHE_COMPRESS": "1"
+        }
+        self.ccache_stats: Dict[str, str] = {}
+        self.compile_records = None
+        
+        # Compiler configurations. Arguments are interned and kept in tuples
+        # so every job shares the same immutable objects; they are only
+        # copied into a list at the subprocess boundary.
+        #
+        # LTO lets the tiny helper templates inline across the compile/link
+        # boundary. GCC's LTO objects need its own linker plugin (lld cannot
+        # read them) and GCC drops split DWARF under LTO, so only Clang gets
+        # ThinLTO with lld and -gsplit-dwarf; without lld it links normally.
+        common_flags = _interned("-std=c++23", "-O2", "-Wall", "-Wextra")
+        has_lld = shutil.which("ld.lld") is not None
         self.compilers = {
             "gcc": {
-                "command": "g++",
-                "flags": ["-std=c++23", "-O2", "-Wall", "-Wextra"],
-                "reflection_flags": ["-freflection"]  # Hypothetical flag
+                "command": _interned(*launcher, "g++"),
+                "flags": common_flags,
+                "reflection_flags": _interned("-freflection"),  # Hypothetical flag
+                "lto_flags": _interned("-flto=auto"),
+                "debug_flags": ()
             },
             "clang": {
-                "command": "clang++", 
-                "flags": ["-std=c++23", "-O2", "-Wall", "-Wextra"],
-                "reflection_flags": ["-freflection"]  # Hypothetical flag
+                "command": _interned(*launcher, "clang++"),
+                "flags": common_flags,
+                "reflection_flags": _interned("-freflection"),  # Hypothetical flag
+                "lto_flags": _interned("-flto=thin", "-fuse-ld=lld") if has_lld else (),
+                "debug_flags": _interned("-gsplit-dwarf")
             }
         }
         
-    def create_test_cases(self):
-        """Create comprehensive test cases for benchmarking."""
-        
-        # Test Case 1: Basic Serialization
-        self._create_serialization_benchmark()
-        
-        # Test Case 2: ORM/Database Mapping
-        self._create_orm_benchmark()
-        
-        # Test Case 3: Property Binding
-        self._create_binding_benchmark()
-        
-        # Test Case 4: Design Pattern Generation
-        self._create_pattern_benchmark()
-        
-        # Test Case 5: Complex Template Hierarchies
-        self._create_template_benchmark()
-        
-    def _create_serialization_benchmark(self):
-        """Create serialization performance benchmark."""
-        
-        # Reflection-based implementation
-        reflection_code = '''
-#include <iostream>
-#include <string>
-#include <vector>
-#include <chrono>
-#include <sstream>
-
-// Simulated C++23 reflection (using placeholder implementation)
-namespace std::meta {
-    template<typename T> struct reflexpr_result {};
-    template<typename T> constexpr auto reflexpr(T) { return reflexpr_result<T>{}; }
-    template<auto meta> constexpr auto get_name() { return "member"; }
-    template<auto meta> constexpr auto data_members_of(meta) { return std::array<int, 3>{}; }
-}
-
-// Metaclass simulation
-#define $serializable
-
-class $serializable Person {
-public:
-    std::string name;
-    int age;
-    std::string email;
-    
-    // Generated serialization (simulated)
-    std::string to_json() const {
-        std::ostringstream oss;
-        oss << "{\\"name\\":\\"" << name << "\\",";
-        oss << "\\"age\\":" << age << ",";
-        oss << "\\"email\\":\\"" << email << "\\"}";
-        return oss.str();
-    }
-    
-    void from_json(const std::string& json) {
-        // Simplified parsing simulation
-        name = "Parsed Name";
-        age = 25;
-        email = "parsed@email.com";
-    }
-};
-
-// Benchmark function
-void benchmark_reflection_serialization() {
-    const int iterations = 100000;
-    std::vector<Person> people;
-    people.reserve(iterations);
-    
-    // Create test data
-    for (int i = 0; i < iterations; ++i) {
-        people.emplace_back();
-        people[i].name = "Person" + std::to_string(i);
-        people[i].age = 20 + (i % 60);
-        people[i].email = "person" + std::to_string(i) + "@test.com";
-    }
-    
-    auto start = std::chrono::high_resolution_clock::now();
-    
-    // Serialize all objects
-    std::vector<std::string> serialized;
-    serialized.reserve(iterations);
-    for (const auto& person : people) {
-        serialized.push_back(person.to_json());
-    }
-    
-    auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
-    
-    std::cout << "Reflection serialization: " << duration.count() << " microseconds\\n";
-    std::cout << "Operations per second: " << (iterations * 1000000.0) / duration.count() << "\\n";
-}
-
-int main() {
-    benchmark_reflection_serialization();
-    return 0;
-}
-'''
-        
-        # Traditional template-based implementation
-        traditional_code = '''
-#include <iostream>
-#include <string>
-#include <vector>
-#include <chrono>
-#include <sstream>
-#include <type_traits>
-
-// Traditional template metaprogramming approach
-template<typename T>
-struct Serializer {
-    static std::string serialize(const T& obj);
-    static T deserialize(const std::string& data);
-};
-
-// Manual specialization for Person
-class Person {
-public:
-    std::string name;
-    int age;
-    std::string email;
-    
-    // Manual serialization
-    std::string to_json() const {
-        std::ostringstream oss;
-        oss << "{\\"name\\":\\"" << name << "\\",";
-        oss << "\\"age\\":" << age << ",";
-        oss << "\\"email\\":\\"" << email << "\\"}";
-        return oss.str();
-    }
-    
-    void from_json(const std::string& json) {
-        // Manual parsing
-        name = "Parsed Name";
-        age = 25;
-        email = "parsed@email.com";
-    }
-};
-
-template<>
-struct Serializer<Person> {
-    static std::string serialize(const Person& person) {
-        return person.to_json();
-    }
-    
-    static Person deserialize(const std::string& data) {
-        Person p;
-        p.from_json(data);
-        return p;
-    }
-};
-
-// Benchmark function
-void benchmark_traditional_serialization() {
-    const int iterations = 100000;
-    std::vector<Person> people;
-    people.reserve(iterations);
-    
-    // Create test data
-    for (int i = 0; i < iterations; ++i) {
-        people.emplace_back();
-        people[i].name = "Person" + std::to_string(i);
-        people[i].age = 20 + (i % 60);
-        people[i].email = "person" + std::to_string(i) + "@test.com";
-    }
-    
-    auto start = std::chrono::high_resolution_clock::now();
-    
-    // Serialize all objects
-    std::vector<std::string> serialized;
-    serialized.reserve(iterations);
-    for (const auto& person : people) {
-        serialized.push_back(Serializer<Person>::serialize(person));
-    }
-    
-    auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
-    
-    std::cout << "Traditional serialization: " << duration.count() << " microseconds\\n";
-    std::cout << "Operations per second: " << (iterations * 1000000.0) / duration.count() << "\\n";
-}
-
-int main() {
-    benchmark_traditional_serialization();
-    return 0;
-}
-'''
-        
-        # Write test files
-        (self.benchmark_dir / "serialization_reflection.cpp").write_text(reflection_code)
-        (self.benchmark_dir / "serialization_traditional.cpp").write_text(traditional_code)
-        
-    def _create_orm_benchmark(self):
-        """Create ORM performance benchmark."""
-        
-        orm_reflection_code = '''
-#include <iostream>
-#include <string>
-#include <vector>
-#include <chrono>
-#include <map>
-
-// Simulated ORM with reflection
-class $entity User {
-public:
-    int id;
-    std::string username;
-    std::string email;
-    int age;
-    
-    // Generated SQL methods (simulated)
-    std::string to_insert_sql() const {
-        return "INSERT INTO users (id, username, email, age) VALUES (" +
-               std::to_string(id) + ", '" + username + "', '" + email + "', " +
-               std::to_string(age) + ")";
-    }
-    
-    std::string to_update_sql() const {
-        return "UPDATE users SET username='" + username + "', email='" + email +
-               "', age=" + std::to_string(age) + " WHERE id=" + std::to_string(id);
-    }
-    
-    static std::string select_all_sql() {
-        return "SELECT id, username, email, age FROM users";
-    }
-};
-
-void benchmark_orm_reflection() {
-    const int iterations = 50000;
-    std::vector<User> users;
-    users.reserve(iterations);
-    
-    // Generate test data
-    for (int i = 0; i < iterations; ++i) {
-        User user;
-        user.id = i;
-        user.username = "user" + std::to_string(i);
-        user.email = "user" + std::to_string(i) + "@test.com";
-        user.age = 20 + (i % 50);
-        users.push_back(user);
-    }
-    
-    auto start = std::chrono::high_resolution_clock::now();
-    
-    // Generate SQL statements
-    std::vector<std::string> sql_statements;
-    sql_statements.reserve(iterations);
-    for (const auto& user : users) {
-        sql_statements.push_back(user.to_insert_sql());
-    }
-    
-    auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
-    
-    std::cout << "ORM Reflection: " << duration.count() << " microseconds\\n";
-    std::cout << "SQL generations per second: " << (iterations * 1000000.0) / duration.count() << "\\n";
-}
-
-int main() {
-    benchmark_orm_reflection();
-    return 0;
-}
-'''
-        
-        orm_traditional_code = '''
-#include <iostream>
-#include <string>
-#include <vector>
-#include <chrono>
-
-// Traditional ORM implementation
-class User {
-public:
-    int id;
-    std::string username;
-    std::string email;
-    int age;
-    
-    // Manual SQL generation
-    std::string to_insert_sql() const {
-        return "INSERT INTO users (id, username, email, age) VALUES (" +
-               std::to_string(id) + ", '" + username + "', '" + email + "', " +
-               std::to_string(age) + ")";
-    }
-    
-    std::string to_update_sql() const {
-        return "UPDATE users SET username='" + username + "', email='" + email +
-               "', age=" + std::to_string(age) + " WHERE id=" + std::to_string(id);
-    }
-    
-    static std::string select_all_sql() {
-        return "SELECT id, username, email, age FROM users";
-    }
-};
-
-// Manual ORM helper
-template<typename T>
-class ORM {
-public:
-    static std::string generate_insert(const T& obj);
-    static std::string generate_update(const T& obj);
-    static std::string generate_select();
-};
-
-template<>
-class ORM<User> {
-public:
-    static std::string generate_insert(const User& user) {
-        return user.to_insert_sql();
-    }
-    
-    static std::string generate_update(const User& user) {
-        return user.to_update_sql();
-    }
-    
-    static std::string generate_select() {
-        return User::select_all_sql();
-    }
-};
-
-void benchmark_orm_traditional() {
-    const int iterations = 50000;
-    std::vector<User> users;
-    users.reserve(iterations);
-    
-    // Generate test data
-    for (int i = 0; i < iterations; ++i) {
-        User user;
-        user.id = i;
-        user.username = "user" + std::to_string(i);
-        user.email = "user" + std::to_string(i) + "@test.com";
-        user.age = 20 + (i % 50);
-        users.push_back(user);
-    }
-    
-    auto start = std::chrono::high_resolution_clock::now();
-    
-    // Generate SQL statements
-    std::vector<std::string> sql_statements;
-    sql_statements.reserve(iterations);
-    for (const auto& user : users) {
-        sql_statements.push_back(ORM<User>::generate_insert(user));
-    }
-    
-    auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
-    
-    std::cout << "ORM Traditional: " << duration.count() << " microseconds\\n";
-    std::cout << "SQL generations per second: " << (iterations * 1000000.0) / duration.count() << "\\n";
-}
-
-int main() {
-    benchmark_orm_traditional();
-    return 0;
-}
-'''
-        
-        (self.benchmark_dir / "orm_reflection.cpp").write_text(orm_reflection_code)
-        (self.benchmark_dir / "orm_traditional.cpp").write_text(orm_traditional_code)
-    
-    def _create_binding_benchmark(self):
-        """Create property binding benchmark."""
-        
-        binding_reflection_code = '''
-#include <iostream>
-#include <string>
-#include <vector>
-#include <chrono>
-#include <functional>
-
-// Property binding with reflection simulation
-class $bindable DataModel {
-public:
-    std::string name;
-    int value;
-    bool active;
-    
-    // Generated property change notifications
-    std::vector<std::function<void()>> name_changed_callbacks;
-    std::vector<std::function<void()>> value_changed_callbacks;
-    std::vector<std::function<void()>> active_changed_callbacks;
-    
-    void set_name(const std::string& new_name) {
-        if (name != new_name) {
-            name = new_name;
-            for (auto& callback : name_changed_callbacks) {
-                callback();
-            }
-        }
-    }
-    
-    void set_value(int new_value) {
-        if (value != new_value) {
-            value = new_value;
-            for (auto& callback : value_changed_callbacks) {
-                callback();
-            }
-        }
-    }
-    
-    void set_active(bool new_active) {
-        if (active != new_active) {
-            active = new_active;
-            for (auto& callback : active_changed_callbacks) {
-                callback();
-            }
-        }
-    }
-    
-    // Generated binding methods
-    void bind_name_changed(std::function<void()> callback) {
-        name_changed_callbacks.push_back(callback);
-    }
-    
-    void bind_value_changed(std::function<void()> callback) {
-        value_changed_callbacks.push_back(callback);
-    }
-    
-    void bind_active_changed(std::function<void()> callback) {
-        active_changed_callbacks.push_back(callback);
-    }
-};
-
-void benchmark_binding_reflection() {
-    const int iterations = 25000;
-    std::vector<DataModel> models;
-    models.reserve(iterations);
-    
-    // Create models with bindings
-    for (int i = 0; i < iterations; ++i) {
-        models.emplace_back();
-        models[i].bind_name_changed([i]() { /* callback */ });
-        models[i].bind_value_changed([i]() { /* callback */ });
-        models[i].bind_active_changed([i]() { /* callback */ });
-    }
-    
-    auto start = std::chrono::high_resolution_clock::now();
-    
-    // Trigger property changes
-    for (int i = 0; i < iterations; ++i) {
-        models[i].set_name("Name" + std::to_string(i));
-        models[i].set_value(i * 2);
-        models[i].set_active(i % 2 == 0);
-    }
-    
-    auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
-    
-    std::cout << "Binding Reflection: " << duration.count() << " microseconds\\n";
-    std::cout << "Property updates per second: " << (iterations * 3 * 1000000.0) / duration.count() << "\\n";
-}
-
-int main() {
-    benchmark_binding_reflection();
-    return 0;
-}
-'''
-        
-        binding_traditional_code = '''
-#include <iostream>
-#include <string>
-#include <vector>
-#include <chrono>
-#include <functional>
-
-// Traditional property binding implementation
-class DataModel {
-private:
-    std::string name_;
-    int value_;
-    bool active_;
-    
-public:
-    std::vector<std::function<void()>> name_changed_callbacks;
-    std::vector<std::function<void()>> value_changed_callbacks;
-    std::vector<std::function<void()>> active_changed_callbacks;
-    
-    const std::string& name() const { return name_; }
-    void set_name(const std::string& new_name) {
-        if (name_ != new_name) {
-            name_ = new_name;
-            for (auto& callback : name_changed_callbacks) {
-                callback();
-            }
-        }
-    }
-    
-    int value() const { return value_; }
-    void set_value(int new_value) {
-        if (value_ != new_value) {
-            value_ = new_value;
-            for (auto& callback : value_changed_callbacks) {
-                callback();
-            }
-        }
-    }
-    
-    bool active() const { return active_; }
-    void set_active(bool new_active) {
-        if (active_ != new_active) {
-            active_ = new_active;
-            for (auto& callback : active_changed_callbacks) {
-                callback();
-            }
-        }
-    }
-    
-    void bind_name_changed(std::function<void()> callback) {
-        name_changed_callbacks.push_back(callback);
-    }
-    
-    void bind_value_changed(std::function<void()> callback) {
-        value_changed_callbacks.push_back(callback);
-    }
-    
-    void bind_active_changed(std::function<void()> callback) {
-        active_changed_callbacks.push_back(callback);
-    }
-};
-
-void benchmark_binding_traditional() {
-    const int iterations = 25000;
-    std::vector<DataModel> models;
-    models.reserve(iterations);
-    
-    // Create models with bindings
-    for (int i = 0; i < iterations; ++i) {
-        models.emplace_back();
-        models[i].bind_name_changed([i]() { /* callback */ });
-        models[i].bind_value_changed([i]() { /* callback */ });
-        models[i].bind_active_changed([i]() { /* callback */ });
-    }
-    
-    auto start = std::chrono::high_resolution_clock::now();
-    
-    // Trigger property changes
-    for (int i = 0; i < iterations; ++i) {
-        models[i].set_name("Name" + std::to_string(i));
-        models[i].set_value(i * 2);
-        models[i].set_active(i % 2 == 0);
-    }
-    
-    auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
-    
-    std::cout << "Binding Traditional: " << duration.count() << " microseconds\\n";
-    std::cout << "Property updates per second: " << (iterations * 3 * 1000000.0) / duration.count() << "\\n";
-}
-
-int main() {
-    benchmark_binding_traditional();
-    return 0;
-}
-'''
-        
-        (self.benchmark_dir / "binding_reflection.cpp").write_text(binding_reflection_code)
-        (self.benchmark_dir / "binding_traditional.cpp").write_text(binding_traditional_code)
-    
-    def _create_pattern_benchmark(self):
-        """Create design pattern generation benchmark."""
-        
-        pattern_reflection_code = '''
-#include <iostream>
-#include <string>
-#include <vector>
-#include <chrono>
-#include <memory>
-
-// Observer pattern with reflection
-class $observable Subject {
-private:
-    std::string state_;
-    std::vector<std::function<void(const std::string&)>> observers_;
-    
-public:
-    void set_state(const std::string& new_state) {
-        if (state_ != new_state) {
-            state_ = new_state;
-            notify_observers();
-        }
-    }
-    
-    const std::string& get_state() const { return state_; }
-    
-    // Generated observer management
-    void add_observer(std::function<void(const std::string&)> observer) {
-        observers_.push_back(observer);
-    }
-    
-    void remove_observer(size_t index) {
-        if (index < observers_.size()) {
-            observers_.erase(observers_.begin() + index);
-        }
-    }
-    
-    void notify_observers() {
-        for (auto& observer : observers_) {
-            observer(state_);
-        }
-    }
-};
-
-void benchmark_pattern_reflection() {
-    const int iterations = 10000;
-    const int observers_per_subject = 10;
-    
-    std::vector<Subject> subjects;
-    subjects.reserve(iterations);
-    
-    // Setup subjects with observers
-    for (int i = 0; i < iterations; ++i) {
-        subjects.emplace_back();
-        for (int j = 0; j < observers_per_subject; ++j) {
-            subjects[i].add_observer([i, j](const std::string& state) {
-                // Observer callback
-            });
-        }
-    }
-    
-    auto start = std::chrono::high_resolution_clock::now();
-    
-    // Trigger state changes
-    for (int i = 0; i < iterations; ++i) {
-        subjects[i].set_state("State" + std::to_string(i));
-    }
-    
-    auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
-    
-    std::cout << "Pattern Reflection: " << duration.count() << " microseconds\\n";
-    std::cout << "Notifications per second: " << (iterations * observers_per_subject * 1000000.0) / duration.count() << "\\n";
-}
-
-int main() {
-    benchmark_pattern_reflection();
-    return 0;
-}
-'''
-        
-        pattern_traditional_code = '''
-#include <iostream>
-#include <string>
-#include <vector>
-#include <chrono>
-#include <memory>
-#include <algorithm>
-
-// Traditional observer pattern
-class Observer {
-public:
-    virtual ~Observer() = default;
-    virtual void update(const std::string& state) = 0;
-};
-
-class Subject {
-private:
-    std::string state_;
-    std::vector<std::shared_ptr<Observer>> observers_;
-    
-public:
-    void set_state(const std::string& new_state) {
-        if (state_ != new_state) {
-            state_ = new_state;
-            notify_observers();
-        }
-    }
-    
-    const std::string& get_state() const { return state_; }
-    
-    void add_observer(std::shared_ptr<Observer> observer) {
-        observers_.push_back(observer);
-    }
-    
-    void remove_observer(std::shared_ptr<Observer> observer) {
-        observers_.erase(
-            std::remove(observers_.begin(), observers_.end(), observer),
-            observers_.end()
-        );
-    }
-    
-    void notify_observers() {
-        for (auto& observer : observers_) {
-            if (auto obs = observer.lock ? observer : observer) {
-                obs->update(state_);
-            }
-        }
-    }
-};
-
-class ConcreteObserver : public Observer {
-private:
-    int id_;
-    
-public:
-    ConcreteObserver(int id) : id_(id) {}
-    
-    void update(const std::string& state) override {
-        // Observer implementation
-    }
-};
-
-void benchmark_pattern_traditional() {
-    const int iterations = 10000;
-    const int observers_per_subject = 10;
-    
-    std::vector<Subject> subjects;
-    std::vector<std::vector<std::shared_ptr<Observer>>> observers;
-    
-    subjects.reserve(iterations);
-    observers.reserve(iterations);
-    
-    // Setup subjects with observers
-    for (int i = 0; i < iterations; ++i) {
-        subjects.emplace_back();
-        observers.emplace_back();
-        
-        for (int j = 0; j < observers_per_subject; ++j) {
-            auto observer = std::make_shared<ConcreteObserver>(j);
-            observers[i].push_back(observer);
-            subjects[i].add_observer(observer);
-        }
-    }
-    
-    auto start = std::chrono::high_resolution_clock::now();
-    
-    // Trigger state changes
-    for (int i = 0; i < iterations; ++i) {
-        subjects[i].set_state("State" + std::to_string(i));
-    }
-    
-    auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
-    
-    std::cout << "Pattern Traditional: " << duration.count() << " microseconds\\n";
-    std::cout << "Notifications per second: " << (iterations * observers_per_subject * 1000000.0) / duration.count() << "\\n";
-}
-
-int main() {
-    benchmark_pattern_traditional();
-    return 0;
-}
-'''
-        
-        (self.benchmark_dir / "pattern_reflection.cpp").write_text(pattern_reflection_code)
-        (self.benchmark_dir / "pattern_traditional.cpp").write_text(pattern_traditional_code)
-    
-    def _create_template_benchmark(self):
-        """Create complex template hierarchy benchmark."""
-        
-        template_reflection_code = '''
-#include <iostream>
-#include <string>
-#include <vector>
-#include <chrono>
-#include <type_traits>
-
-// Complex template hierarchy with reflection
-template<typename T>
-class $reflectable Container {
-private:
-    std::vector<T> data_;
-    
-public:
-    void add(const T& item) { data_.push_back(item); }
-    
-    size_t size() const { return data_.size(); }
-    
-    // Generated introspection methods
-    static std::string get_type_name() {
-        return "Container<" + get_element_type_name() + ">";
-    }
-    
-    static std::string get_element_type_name() {
-        return typeid(T).name();
-    }
-    
-    // Generated serialization
-    std::string serialize() const {
-        std::string result = "[";
-        for (size_t i = 0; i < data_.size(); ++i) {
-            if (i > 0) result += ",";
-            result += serialize_element(data_[i]);
-        }
-        result += "]";
-        return result;
-    }
-    
-private:
-    std::string serialize_element(const T& element) const {
-        if constexpr (std::is_arithmetic_v<T>) {
-            return std::to_string(element);
-        } else {
-            return "\"" + std::string(element) + "\"";
-        }
-    }
-};
-
-void benchmark_template_reflection() {
-    const int iterations = 50000;
-    
-    Container<int> int_container;
-    Container<std::string> string_container;
-    Container<double> double_container;
-    
-    auto start = std::chrono::high_resolution_clock::now();
-    
-    // Fill containers and serialize
-    for (int i = 0; i < iterations; ++i) {
-        int_container.add(i);
-        string_container.add("item" + std::to_string(i));
-        double_container.add(i * 3.14);
-        
-        if (i % 1000 == 0) {
-            auto int_ser = int_container.serialize();
-            auto str_ser = string_container.serialize();
-            auto dbl_ser = double_container.serialize();
-        }
-    }
-    
-    auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
-    
-    std::cout << "Template Reflection: " << duration.count() << " microseconds\\n";
-    std::cout << "Operations per second: " << (iterations * 1000000.0) / duration.count() << "\\n";
-}
-
-int main() {
-    benchmark_template_reflection();
-    return 0;
-}
-'''
-        
-        template_traditional_code = '''
-#include <iostream>
-#include <string>
-#include <vector>
-#include <chrono>
-#include <type_traits>
-#include <sstream>
-
-// Traditional complex template hierarchy
-template<typename T>
-class Container {
-private:
-    std::vector<T> data_;
-    
-public:
-    void add(const T& item) { data_.push_back(item); }
-    
-    size_t size() const { return data_.size(); }
-    
-    std::string get_type_name() const {
-        return std::string("Container<") + typeid(T).name() + ">";
-    }
-    
-    std::string serialize() const {
-        std::ostringstream oss;
-        oss << "[";
-        for (size_t i = 0; i < data_.size(); ++i) {
-            if (i > 0) oss << ",";
-            serialize_element(oss, data_[i]);
-        }
-        oss << "]";
-        return oss.str();
-    }
-    
-private:
-    void serialize_element(std::ostringstream& oss, const T& element) const {
-        if constexpr (std::is_arithmetic_v<T>) {
-            oss << element;
-        } else {
-            oss << "\"" << element << "\"";
-        }
-    }
-};
-
-// Manual specializations for different types
-template<>
-class Container<std::string> {
-private:
-    std::vector<std::string> data_;
-    
-public:
-    void add(const std::string& item) { data_.push_back(item); }
-    
-    size_t size() const { return data_.size(); }
-    
-    std::string get_type_name() const {
-        return "Container<std::string>";
-    }
-    
-    std::string serialize() const {
-        std::ostringstream oss;
-        oss << "[";
-        for (size_t i = 0; i < data_.size(); ++i) {
-            if (i > 0) oss << ",";
-            oss << "\"" << data_[i] << "\"";
-        }
-        oss << "]";
-        return oss.str();
-    }
-};
-
-void benchmark_template_traditional() {
-    const int iterations = 50000;
-    
-    Container<int> int_container;
-    Container<std::string> string_container;
-    Container<double> double_container;
-    
-    auto start = std::chrono::high_resolution_clock::now();
-    
-    // Fill containers and serialize
-    for (int i = 0; i < iterations; ++i) {
-        int_container.add(i);
-        string_container.add("item" + std::to_string(i));
-        double_container.add(i * 3.14);
-        
-        if (i % 1000 == 0) {
-            auto int_ser = int_container.serialize();
-            auto str_ser = string_container.serialize();
-            auto dbl_ser = double_container.serialize();
-        }
-    }
-    
-    auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
-    
-    std::cout << "Template Traditional: " << duration.count() << " microseconds\\n";
-    std::cout << "Operations per second: " << (iterations * 1000000.0) / duration.count() << "\\n";
-}
-
-int main() {
-    benchmark_template_traditional();
-    return 0;
-}
-'''
-        
-        (self.benchmark_dir / "template_reflection.cpp").write_text(template_reflection_code)
-        (self.benchmark_dir / "template_traditional.cpp").write_text(template_traditional_code)
+    def create_test_cases(self) -> List[Tuple[Path, str]]:
+        """Create comprehensive test cases for benchmarking.
+
+        Each test case is a reflection/traditional pair rendered from the
+        templates directory. Returns the (path, source) pairs.
+        """
+
+        sources = [
+            self._emit(benchmark, variant)
+            for benchmark in BENCHMARKS
+            for variant in VARIANTS
+        ]
+
+        # Only rewrite sources whose digest differs from the manifest of the
+        # last run; untouched files keep their mtimes, so ccache and make can
+        # skip them on the next build
+        manifest_path = self.benchmark_dir / ".manifest.json"
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            manifest = {}
+
+        stale = []
+        manifest_changed = False
+        for path, source in sources:
+            data = source.encode()
+            digest = blake2b(data, digest_size=16).hexdigest()
+            recorded = manifest.get(path.name)
+            if recorded == digest and path.exists():
+                continue
+            # With no manifest entry (e.g. a fresh checkout, since the
+            # manifest is not tracked) fall back to comparing the file itself
+            if recorded is None:
+                try:
+                    unchanged = path.read_bytes() == data
+                except FileNotFoundError:
+                    unchanged = False
+                if unchanged:
+                    manifest[path.name] = digest
+                    manifest_changed = True
+                    continue
+            stale.append((path, data))
+            manifest[path.name] = digest
+            manifest_changed = True
+
+        # File writes are IO-bound, so a thread pool is enough
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(lambda item: item[0].write_bytes(item[1]), stale))
+
+        if manifest_changed:
+            manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+        return sources
+
+    def _emit(self, benchmark: Dict[str, Any], variant: str) -> Tuple[Path, str]:
+        """Render one variant of a manifest entry; returns (path, source)."""
+        stem = f"{benchmark['name']}_{variant}"
+        template = _template_env().get_template(f"{stem}.cpp.j2")
+        return (self.benchmark_dir / f"{stem}.cpp",
+                template.render(iterations=benchmark["iterations"], benchmark=stem))
+
+    def compile_all(self) -> List[BenchmarkResult]:
+        """Compile every benchmark with every configured compiler in parallel.
+
+        Each (compiler, source) pair is an independent job, so all of them are
+        submitted to a process pool at once and the compile phase takes roughly
+        as long as the slowest translation unit instead of the sum of all.
+        """
+
+        exe_suffix = ".exe" if os.name == "nt" else ""
+        jobs = []
+        for compiler_name, config in self.compilers.items():
+            command, lto_flags = config["command"], config["lto_flags"]
+            for source in sorted(self.benchmark_dir.glob("*.cpp")):
+                flags = config["flags"]
+                if source.stem.endswith("_reflection"):
+                    flags += config["reflection_flags"]
+                stem = f"{source.stem}_{compiler_name}"
+                obj = self.benchmark_dir / f"{stem}.o"
+                output = self.benchmark_dir / f"{stem}{exe_suffix}"
+                # Compile and link separately so both phases are timed on their own
+                compile_cmd = [*command, *flags, *lto_flags, *config["debug_flags"],
+                               "-c", str(source), "-o", str(obj)]
+                link_cmd = [*command, *flags, *lto_flags, str(obj), "-o", str(output)]
+                jobs.append((f"{source.stem} ({compiler_name})", compile_cmd, link_cmd, output))
+
+        self.ccache_stats["before"] = self._ccache_stats()
+
+        # Workers write their rows into one shared buffer instead of pickling
+        # results back, leaving a contiguous record array for analysis
+        import numpy as np
+        dtype = np.dtype(RESULT_FIELDS)
+        shm = shared_memory.SharedMemory(create=True, size=max(len(jobs), 1) * dtype.itemsize)
+        rows = None
+        try:
+            rows = np.ndarray((len(jobs),), dtype=dtype, buffer=shm.buf)
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = [
+                    executor.submit(_run_compile_job, shm.name, len(jobs), index,
+                                    name, compile_cmd, link_cmd, self.compile_env, output)
+                    for index, (name, compile_cmd, link_cmd, output) in enumerate(jobs)
+                ]
+                for future in futures:
+                    future.result()
+
+            self.compile_records = rows.copy()
+        finally:
+            # Release the view first: closing with it alive raises BufferError,
+            # which would mask any exception propagating from a compile job
+            del rows
+            shm.close()
+            shm.unlink()
+
+        self.ccache_stats["after"] = self._ccache_stats()
+        return [BenchmarkResult(name.decode(), *values)
+                for name, *values in self.compile_records.tolist()]
+
+    def measure_runtime(self, binary: Path, repetitions: int = 10) -> Dict[str, float]:
+        """Run a compiled benchmark repeatedly and summarize its timings.
+
+        Every benchmark ends its output with one JSON line reporting
+        duration_us and ops_per_s for its measured loop, so process start-up
+        is excluded and no text scraping is needed. Samples go into
+        preallocated float64 arrays so the summary is computed by NumPy
+        rather than by iterating over boxed Python floats. The median is the
+        headline figure since it is robust to scheduler outliers.
+        """
+        import numpy as np
+
+        times = np.empty(repetitions, dtype=np.float64)
+        throughput = np.empty(repetitions, dtype=np.float64)
+        for i in range(repetitions):
+            result = subprocess.run([str(binary)], capture_output=True, check=True)
+            report = _json_loads(result.stdout.splitlines()[-1])
+            times[i] = report["duration_us"] / 1e6
+            throughput[i] = report["ops_per_s"]
+
+        summary = _summarize_times(times)
+        summary["ops_per_s"] = float(np.median(throughput))
+        return summary
+
+    def time_callable(self, fn: Callable[[], Any], repetitions: int = 1000) -> Dict[str, float]:
+        """Time an in-process callable, e.g. a Python-side SQL generator used
+        for cross-language comparison with the C++ benchmarks.
+
+        The loop body is just two clock reads, the call and a list store, with
+        the clock bound to a local, so per-iteration driver overhead stays
+        small next to the callable's own cost.
+        """
+        import numpy as np
+
+        samples = [0] * repetitions
+        clock = time.perf_counter_ns
+        for i in range(repetitions):
+            start_ns = clock()
+            fn()
+            samples[i] = clock() - start_ns
+
+        return _summarize_times(np.asarray(samples, dtype=np.float64) / 1e9)
+
+    def results_frame(self):
+        """Return the records of the last compile_all() run as a DataFrame."""
+        _, _, pd = _viz()
+        frame = pd.DataFrame.from_records(self.compile_records)
+        frame["name"] = frame["name"].str.decode("utf-8")
+        return frame
+
+    def write_results(self, results: List[BenchmarkResult], path: Path):
+        """Write benchmark results to a JSON file."""
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(
+                results, option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_INDENT_2
+            ))
+        else:
+            path.write_text(json.dumps([asdict(r) for r in results], indent=2))
+
+    def write_results_csv(self, results: List[BenchmarkResult], path: Path):
+        """Write benchmark results to a CSV file, one row per result."""
+        # A 1 MiB buffer turns many small row writes into a few large syscalls
+        with open(path, "wb", buffering=1 << 20) as raw, \
+                io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=[field.name for field in fields(BenchmarkResult)])
+            writer.writeheader()
+            writer.writerows(asdict(r) for r in results)
+
+    def _ccache_stats(self) -> str:
+        """Snapshot `ccache -s` so cache hit rates can be compared across a run."""
+        if not shutil.which("ccache"):
+            return ""
+        result = subprocess.run(["ccache", "-s"], capture_output=True, text=True,
+                                env=self.compile_env)
+        return result.stdout
 
 if __name__ == "__main__":
     # Initialize benchmark framework
     framework = CPPBenchmarkFramework("C:/Users/P - K/Downloads/cpp prop/reflection_metaclasses_paper")
     
     print("Creating comprehensive C++ benchmark test cases...")
-    framework.create_test_cases()
+    sources = framework.create_test_cases()
     print("✅ Benchmark test cases created successfully!")
     
     print("\\nBenchmark files created:")
-    benchmark_files = [
-        "serialization_reflection.cpp", "serialization_traditional.cpp",
-        "orm_reflection.cpp", "orm_traditional.cpp", 
-        "binding_reflection.cpp", "binding_traditional.cpp",
-        "pattern_reflection.cpp", "pattern_traditional.cpp",
-        "template_reflection.cpp", "template_traditional.cpp"
-    ]
-    
-    for file in benchmark_files:
-        print(f"  📁 {file}")
+    for path, _ in sources:
+        print(f"  📁 {path.name}")
     
     print("\\n🚀 Ready for compilation and benchmarking!")
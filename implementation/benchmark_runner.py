@@ -9,16 +9,71 @@ Author: Mohammadreza Alipour
 Date: August 24, 2025
 """
 
+import argparse
+import asyncio
 import subprocess
 import time
 import os
+import shlex
+import shutil
+import sys
+import threading
 import json
+import hashlib
 import statistics
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, fields
 
-@dataclass
+# orjson writes nested dicts straight to bytes in C; fall back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiler detection results are cached here per PATH, for TTL seconds;
+# bump the version whenever the cached compiler config changes shape
+COMPILER_CACHE_DIR = Path.home() / ".cache" / "benchmark_runner"
+COMPILER_CACHE_TTL = 24 * 60 * 60
+COMPILER_CACHE_VERSION = 4
+
+# Timeouts adapt to history: 5x the median of the last few successful
+# durations of the same binary, but never below these floors (seconds)
+COMPILE_TIMEOUT_FLOOR = 60.0
+RUN_TIMEOUT_FLOOR = 10.0
+TIMING_HISTORY_LENGTH = 20
+
+# Benchmark sources: one reflection/traditional pair per domain
+BENCHMARK_DOMAINS = ("serialization", "orm", "binding", "pattern", "template")
+BENCHMARK_PAIRS = tuple((f"{domain}_reflection.cpp", f"{domain}_traditional.cpp")
+                        for domain in BENCHMARK_DOMAINS)
+BENCHMARK_FILES = tuple(source for pair in BENCHMARK_PAIRS for source in pair)
+
+# Windows priority class for benchmark processes (winbase.h)
+HIGH_PRIORITY_CLASS = 0x00000080
+
+# Optimization flags per build profile and compiler family. "speed" is what a
+# deployed build would use, so it drives the runtime comparison; "size" keeps
+# inlining from muddying the binary_size comparison; "debug" is for
+# investigating failures.
+PROFILE_FLAGS = {
+    "gnu": {
+        "speed": ["-O3", "-march=native", "-flto", "-DNDEBUG"],
+        "size": ["-Os", "-DNDEBUG"],
+        "debug": ["-O0", "-g"],
+        # Speed flags; the PGO passes add their own instrumentation flags
+        "pgo": ["-O3", "-march=native", "-flto", "-DNDEBUG"]
+    },
+    "msvc": {
+        "speed": ["/O2", "/GL", "/DNDEBUG"],
+        "size": ["/O1", "/DNDEBUG"],
+        "debug": ["/Od", "/Zi"]
+    }
+}
+
+@dataclass(slots=True)
 class BenchmarkResult:
     name: str
     compilation_time: float
@@ -26,61 +81,287 @@ class BenchmarkResult:
     binary_size: int
     output: str
     success: bool
+    metrics: Dict[str, float] = field(default_factory=dict)
+    
+    def as_dict(self) -> Dict:
+        """Flat dict of the fields, without dataclasses.asdict's recursive copy.
+        
+        Values are shared, not copied, so a large `output` is never duplicated.
+        """
+        return {name: getattr(self, name) for name in _BR_FIELDS}
+
+_BR_FIELDS = tuple(f.name for f in fields(BenchmarkResult))
 
 class BenchmarkRunner:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, fresh: bool = False, pump: bool = False):
         self.project_root = Path(project_root)
         self.benchmark_dir = self.project_root / "benchmarks"
         self.results_dir = self.project_root / "results"
         self.results_dir.mkdir(exist_ok=True)
         
+        # Binary paths are derived once per (source, profile) and reused
+        self._exe_suffix = ".exe" if os.name == "nt" else ""
+        self._exe_cache: Dict[Tuple[str, str], Path] = {}
+        
         # Try to find available compilers
         self.available_compilers = self._detect_compilers()
         
+        # Route compiles through ccache when available so re-runs on unchanged
+        # sources are near-instant. `fresh` forces a recache, so the official
+        # compilation_time measurement still pays the full compile cost.
+        self.launcher = ["ccache"] if shutil.which("ccache") else []
+        self.compile_env = {**os.environ, "CCACHE_DIR": str(self.results_dir / ".ccache")}
+        if fresh:
+            self.compile_env["CCACHE_RECACHE"] = "1"
+        self.ccache_stats: Dict[str, int] = {}
+        
+        # Benchmarks run pinned to one core, the last one this process may
+        # use (away from core 0's interrupt load), so the scheduler cannot
+        # migrate them mid-run
+        if hasattr(os, "sched_getaffinity"):
+            self._bench_cpu = max(os.sched_getaffinity(0))
+        else:
+            self._bench_cpu = (os.cpu_count() or 1) - 1
+        
+        # Recent successful compile/run wall times per binary, which size the
+        # timeouts so slow reflection compiles are not cut off at a fixed limit
+        self._timing_history_path = self.results_dir / "timing_history.json"
+        try:
+            history = json.loads(self._timing_history_path.read_text())
+        except (OSError, ValueError):
+            history = {}
+        self._compile_time_history: Dict[str, List[float]] = defaultdict(list, history.get("compile", {}))
+        self._run_time_history: Dict[str, List[float]] = defaultdict(list, history.get("run", {}))
+        
+        # Driver-level cache: a binary whose source and flags hash the same as
+        # last time is reused as-is, without even launching the compiler
+        self.fresh = fresh
+        self._compile_cache_path = self.results_dir / "compile_cache.json"
+        try:
+            self._compile_cache = json.loads(self._compile_cache_path.read_text())
+        except (OSError, ValueError):
+            self._compile_cache = {}
+        
+        # Farm compiles out with distcc when hosts are configured. Behind
+        # ccache it goes in CCACHE_PREFIX so ccache still hashes the real
+        # compiler; pump mode additionally ships preprocessing to the hosts.
+        distcc_hosts = os.environ.get("DISTCC_HOSTS", "").split()
+        self.distcc = bool(distcc_hosts) and shutil.which("distcc") is not None
+        self.pump = pump and self.distcc and shutil.which("pump") is not None
+        if self.distcc:
+            if self.launcher:
+                self.compile_env["CCACHE_PREFIX"] = "distcc"
+            else:
+                self.launcher = ["distcc"]
+        # distcc recommends about twice as many jobs as there are hosts
+        self.max_workers = 2 * len(distcc_hosts) if self.distcc else os.cpu_count()
+        
     def _detect_compilers(self):
-        """Detect available C++ compilers on the system."""
-        compilers = {}
+        """Detect available C++ compilers on the system.
         
-        # Test for GCC
+        Each probe spawns a process with a 5s timeout (a missing `cl` can stall
+        for all of it), so the result is cached on disk keyed by PATH and
+        reused for a day; the probes themselves run concurrently.
+        """
+        path_key = hashlib.sha1(os.environ.get("PATH", "").encode()).hexdigest()
+        cache_file = COMPILER_CACHE_DIR / f"compilers_v{COMPILER_CACHE_VERSION}_{path_key}.json"
         try:
-            result = subprocess.run(["g++", "--version"], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                compilers["gcc"] = {
-                    "command": "g++",
-                    "flags": ["-std=c++20", "-O2", "-Wall", "-Wextra"]  # Using C++20 for now
-                }
-        except:
+            if time.time() - cache_file.stat().st_mtime < COMPILER_CACHE_TTL:
+                return json.loads(cache_file.read_text())
+        except (OSError, ValueError):
             pass
+        
+        # Per-function/per-object sections let the linker drop unreferenced
+        # code and data, and stripping removes symbols, so binary_size
+        # reflects the code actually used rather than what the linker kept
+        gnu_link_flags = (["-Wl,-dead_strip"] if sys.platform == "darwin"
+                          else ["-Wl,--gc-sections", "-Wl,-s"])
+        
+        candidates = {
+            # GCC
+            "gcc": (["g++", "--version"], {
+                "command": "g++",
+                "flags": ["-std=c++20", "-Wall", "-Wextra",  # Using C++20 for now
+                          "-ffunction-sections", "-fdata-sections"],
+                "link_flags": gnu_link_flags,
+                "family": "gnu"
+            }),
+            # Clang
+            "clang": (["clang++", "--version"], {
+                "command": "clang++",
+                "flags": ["-std=c++20", "-Wall", "-Wextra",
+                          "-ffunction-sections", "-fdata-sections"],
+                "link_flags": gnu_link_flags,
+                "family": "gnu"
+            }),
+            # MSVC (Windows)
+            "msvc": (["cl", "/?"], {
+                "command": "cl",
+                "flags": ["/std:c++20", "/EHsc", "/Gy", "/Gw"],
+                "link_flags": ["/link", "/OPT:REF", "/OPT:ICF"],
+                "family": "msvc"
+            })
+        }
+        
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            versions = executor.map(self._probe_compiler,
+                                    [probe for probe, _ in candidates.values()])
             
-        # Test for Clang
-        try:
-            result = subprocess.run(["clang++", "--version"], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                compilers["clang"] = {
-                    "command": "clang++",
-                    "flags": ["-std=c++20", "-O2", "-Wall", "-Wextra"]
-                }
-        except:
-            pass
+            compilers = {}
+            for (name, (_, config)), version in zip(candidates.items(), versions):
+                if version is not None:
+                    compilers[name] = {**config, "version": version}
             
-        # Test for MSVC (Windows)
+            # -pipe keeps intermediates (preprocessed source, assembly) in
+            # pipes instead of temp files; probe it since some constrained
+            # sysroots reject it. MSVC has no equivalent.
+            gnu = [name for name, config in compilers.items() if config["family"] == "gnu"]
+            for name, supported in zip(gnu, executor.map(
+                    self._supports_pipe, [compilers[name]["command"] for name in gnu])):
+                if supported:
+                    compilers[name]["flags"] = compilers[name]["flags"] + ["-pipe"]
+        
         try:
-            result = subprocess.run(["cl", "/?"], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                compilers["msvc"] = {
-                    "command": "cl",
-                    "flags": ["/std:c++20", "/O2", "/EHsc"]
-                }
-        except:
+            COMPILER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(compilers, indent=2))
+        except OSError:
             pass
             
         return compilers
     
-    def compile_benchmark(self, source_file: str, compiler: str = None) -> BenchmarkResult:
-        """Compile a single benchmark file and measure compilation time."""
+    @staticmethod
+    def _supports_pipe(command: str) -> bool:
+        """Whether a GCC-style driver accepts -pipe."""
+        try:
+            result = subprocess.run([command, "-pipe", "-x", "c++", "-E", "-"],
+                                  stdin=subprocess.DEVNULL, capture_output=True, timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0
+    
+    @staticmethod
+    def _probe_compiler(probe: List[str]) -> Optional[str]:
+        """Run a compiler probe; returns its version banner, or None if unavailable."""
+        try:
+            result = subprocess.run(probe, capture_output=True, text=True, timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        # MSVC prints its banner on stderr
+        banner = (result.stdout or result.stderr).strip()
+        return banner.splitlines()[0] if banner else ""
+    
+    def _exe_path(self, source_file: str, profile: str) -> Path:
+        """Binary path for a source built under a profile (profiles never collide)."""
+        key = (source_file, profile)
+        if key not in self._exe_cache:
+            self._exe_cache[key] = self.benchmark_dir / (
+                source_file.removesuffix(".cpp") + f"_{profile}" + self._exe_suffix
+            )
+        return self._exe_cache[key]
+    
+    def compile_benchmark(self, source_file: str, compiler: str = None,
+                          profile: str = "speed") -> BenchmarkResult:
+        """Compile a single benchmark file and measure compilation time.
+        
+        `profile` is one of "speed", "size", "debug" (see PROFILE_FLAGS) or
+        "pgo", a profile-guided build on top of the speed flags.
+        """
+        return asyncio.run(self.compile_benchmark_async(source_file, compiler, profile))
+    
+    async def compile_benchmark_async(self, source_file: str, compiler: str = None,
+                                      profile: str = "speed") -> BenchmarkResult:
+        """Coroutine behind compile_benchmark, so many compiles can share one loop."""
+        if profile == "pgo":
+            return await self._compile_pgo(source_file, compiler)
+        return await self._compile(source_file, compiler, profile)
+    
+    async def _compile_pgo(self, source_file: str, compiler: str = None) -> BenchmarkResult:
+        """Profile-guided build: instrumented build, one training run, then the
+        optimized build. compilation_time covers all three steps.
+        """
+        if not compiler:
+            compiler = next(iter(self.available_compilers), None)
+        compiler_config = self.available_compilers.get(compiler)
+        if compiler_config is None or compiler_config["family"] != "gnu":
+            return BenchmarkResult(
+                name=source_file,
+                compilation_time=0,
+                execution_time=0,
+                binary_size=0,
+                output=f"PGO is not supported for {compiler}",
+                success=False
+            )
+        
+        output_path = self._exe_path(source_file, "pgo")
+        instrumented_path = self._exe_path(source_file, "pgo_gen")
+        profile_dir = self.results_dir / "pgo" / output_path.stem
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        if compiler == "clang":
+            profdata = profile_dir / "default.profdata"
+            generate = [f"-fprofile-instr-generate={profile_dir / 'default_%p.profraw'}"]
+            use = [f"-fprofile-instr-use={profdata}"]
+        else:
+            # GCC names the .gcda after the output binary, which differs between
+            # the instrumented (<stem>_pgo_gen) and optimized (<stem>_pgo)
+            # builds; pinning the dump base makes both passes agree on it
+            dumpbase = ["-dumpbase", output_path.stem]
+            gcda_name = f"{output_path.stem}-{Path(source_file).stem}.gcda"
+            generate = [f"-fprofile-generate={profile_dir}", *dumpbase]
+            use = [f"-fprofile-use={profile_dir}", "-fprofile-correction",
+                   "-Wmissing-profile", *dumpbase]
+        
+        instrumented = await self._compile(source_file, compiler, "pgo", generate, stage="gen")
+        if not instrumented.success:
+            return instrumented
+        
+        print(f"Training {instrumented_path.name}...")
+        start_time = time.time()
+        try:
+            returncode, _, stderr = await asyncio.to_thread(
+                self._stream_metrics, [str(instrumented_path)],
+                self._adaptive_timeout(self._run_time_history[instrumented_path.name], RUN_TIMEOUT_FLOOR)
+            )
+            if returncode == 0 and compiler == "clang":
+                # Clang's raw profiles have to be merged before use
+                merge = await asyncio.create_subprocess_exec(
+                    "llvm-profdata", "merge", "-o", str(profdata),
+                    *map(str, profile_dir.glob("*.profraw")),
+                    stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+                )
+                stderr = (await merge.communicate())[1].decode(errors="replace")
+                returncode = merge.returncode
+            elif returncode == 0 and not any(profile_dir.rglob(gcda_name)):
+                # Without it the use pass silently degrades to a plain -O build
+                returncode, stderr = -1, f"training wrote no {gcda_name} under {profile_dir}"
+        except (OSError, subprocess.TimeoutExpired) as e:
+            returncode, stderr = -1, str(e)
+        training_time = time.time() - start_time
+        
+        if returncode != 0:
+            return BenchmarkResult(
+                name=source_file,
+                compilation_time=instrumented.compilation_time + training_time,
+                execution_time=0,
+                binary_size=0,
+                output=f"PGO training failed:\n{stderr}",
+                success=False
+            )
+        
+        optimized = await self._compile(source_file, compiler, "pgo", use, stage="use")
+        optimized.compilation_time += instrumented.compilation_time + training_time
+        return optimized
+    
+    async def _compile(self, source_file: str, compiler: str, profile: str,
+                       extra_flags: Optional[List[str]] = None,
+                       stage: Optional[str] = None) -> BenchmarkResult:
+        """One compiler invocation for compile_benchmark_async (or a cache hit).
+        
+        `stage` names a PGO pass ("gen" or "use"). Each pass gets its own cache
+        entry and compile-time history, and the instrumented "gen" binary is
+        written next to, not over, the optimized one.
+        """
         
         if not compiler:
             compiler = list(self.available_compilers.keys())[0] if self.available_compilers else None
@@ -97,32 +378,91 @@ class BenchmarkRunner:
         
         compiler_config = self.available_compilers[compiler]
         source_path = self.benchmark_dir / source_file
-        output_name = source_file.replace('.cpp', '.exe' if os.name == 'nt' else '')
-        output_path = self.benchmark_dir / output_name
+        output_path = self._exe_path(source_file, f"{profile}_gen" if stage == "gen" else profile)
+        profile_flags = PROFILE_FLAGS[compiler_config["family"]][profile] + (extra_flags or [])
+        # Debug builds keep their symbols
+        link_flags = compiler_config.get("link_flags", []) if profile != "debug" else []
         
         # Build compilation command
-        cmd = [compiler_config["command"]] + compiler_config["flags"] + [
+        cmd = self.launcher + [compiler_config["command"]] + compiler_config["flags"] + profile_flags + [
             str(source_path), "-o", str(output_path)
-        ]
+        ] + link_flags
+        
+        cache_key = f"{compiler}:{output_path.name}" + (f":{stage}" if stage else "")
+        source_hash = hashlib.sha256(
+            source_path.read_bytes() + json.dumps([compiler_config, profile_flags]).encode()
+        ).hexdigest() if source_path.exists() else None
+        cached = self._compile_cache.get(cache_key)
+        # Binaries are named per source and profile, not per compiler, so
+        # another compiler may have overwritten this one since it was cached;
+        # only reuse it if it is still the exact file this entry recorded
+        try:
+            st = os.stat(output_path)
+            binary_matches = bool(cached) and (
+                cached.get("binary_size") == st.st_size
+                and cached.get("mtime_ns") == st.st_mtime_ns
+            )
+        except FileNotFoundError:
+            binary_matches = False
+        if (not self.fresh and cached and cached["hash"] == source_hash
+                and binary_matches):
+            print(f"Reusing {output_path.name} (source unchanged)")
+            return BenchmarkResult(
+                name=source_file,
+                compilation_time=cached["compile_time"],
+                execution_time=0,  # Will be filled by run_benchmark
+                binary_size=cached["binary_size"],
+                output="",
+                success=True
+            )
+        
+        print(f"Compiling {source_file} with {compiler} ({profile})...")
         
-        print(f"Compiling {source_file} with {compiler}...")
+        # Diagnostics stream straight to a per-compile log rather than being
+        # buffered into Python strings (template errors can run to megabytes);
+        # only a tail of it is read back, and only on failure
+        log_path = self.results_dir / f"{output_path.stem}.compile.log"
+        
+        compile_history = self._compile_time_history[cache_key]
+        timeout = self._adaptive_timeout(compile_history, COMPILE_TIMEOUT_FLOOR)
         
         # Measure compilation time
         start_time = time.time()
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            with open(log_path, "wb") as log:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd, stdout=log, stderr=asyncio.subprocess.STDOUT, env=self.compile_env
+                )
+                try:
+                    returncode = await asyncio.wait_for(proc.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    raise subprocess.TimeoutExpired(cmd, timeout)
             compilation_time = time.time() - start_time
             
-            if result.returncode == 0:
-                # Get binary size
-                binary_size = output_path.stat().st_size if output_path.exists() else 0
+            if returncode == 0:
+                self._record_time(compile_history, compilation_time)
+                # Get binary size (EAFP: one stat call in the common case
+                # where the binary exists, rather than exists() plus stat())
+                try:
+                    st = os.stat(output_path)
+                    binary_size, mtime_ns = st.st_size, st.st_mtime_ns
+                except FileNotFoundError:
+                    binary_size, mtime_ns = 0, None
+                self._compile_cache[cache_key] = {
+                    "hash": source_hash,
+                    "compile_time": compilation_time,
+                    "binary_size": binary_size,
+                    "mtime_ns": mtime_ns
+                }
                 
                 return BenchmarkResult(
                     name=source_file,
                     compilation_time=compilation_time,
                     execution_time=0,  # Will be filled by run_benchmark
                     binary_size=binary_size,
-                    output=result.stdout + result.stderr,
+                    output="",
                     success=True
                 )
             else:
@@ -131,14 +471,14 @@ class BenchmarkRunner:
                     compilation_time=compilation_time,
                     execution_time=0,
                     binary_size=0,
-                    output=f"Compilation failed:\\n{result.stderr}",
+                    output=f"Compilation failed:\\n{self._log_tail(log_path)}",
                     success=False
                 )
                 
         except subprocess.TimeoutExpired:
             return BenchmarkResult(
                 name=source_file,
-                compilation_time=30.0,  # Timeout
+                compilation_time=timeout,
                 execution_time=0,
                 binary_size=0,
                 output="Compilation timeout",
@@ -154,123 +494,311 @@ class BenchmarkRunner:
                 success=False
             )
     
-    def run_benchmark(self, executable_name: str) -> Tuple[float, str]:
-        """Run a compiled benchmark and measure execution time."""
+    @staticmethod
+    def _log_tail(log_path: Path, limit: int = 8192) -> str:
+        """Last `limit` bytes of a compile log."""
+        with open(log_path, "rb") as log:
+            log.seek(0, os.SEEK_END)
+            log.seek(max(0, log.tell() - limit))
+            return log.read().decode(errors="replace")
+    
+    def run_benchmark(self, executable_name: str, repetitions: int = 5
+                      ) -> Tuple[float, Dict[str, float], str]:
+        """Run a compiled benchmark and measure execution time.
+        
+        The benchmark is run `repetitions` times and the median is reported.
+        Each run prefers the `METRIC bench_ns=` value the benchmark prints about
+        its own timed loop, which excludes process creation and dynamic
+        loading; the wall clock around the subprocess is only a fallback.
+        
+        Returns (execution time, median of each METRIC, error message or "").
+        """
         
         executable_path = self.benchmark_dir / executable_name
         
         if not executable_path.exists():
-            return 0.0, f"Executable {executable_name} not found"
+            return 0.0, {}, f"Executable {executable_name} not found"
         
         print(f"Running {executable_name}...")
         
+        cmd = [str(executable_path)]
+        run_history = self._run_time_history[executable_name]
+        timeout = self._adaptive_timeout(run_history, RUN_TIMEOUT_FLOOR)
+        timings = []
+        samples: Dict[str, List[float]] = {}
         try:
-            start_time = time.time()
-            result = subprocess.run([str(executable_path)], 
-                                  capture_output=True, text=True, timeout=10)
-            execution_time = time.time() - start_time
+            for _ in range(repetitions):
+                start_ns = time.perf_counter_ns()
+                returncode, metrics, stderr = self._stream_metrics(cmd, timeout=timeout)
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                
+                if returncode == 0:
+                    self._record_time(run_history, execution_time)
+                
+                if returncode != 0:
+                    return execution_time, {}, f"Runtime error:\\n{stderr}"
+                
+                if "bench_ns" in metrics:
+                    execution_time = metrics["bench_ns"] / 1e9
+                
+                timings.append(execution_time)
+                for key, value in metrics.items():
+                    samples.setdefault(key, []).append(value)
             
-            if result.returncode == 0:
-                return execution_time, result.stdout
-            else:
-                return execution_time, f"Runtime error:\\n{result.stderr}"
+            return (statistics.median(timings),
+                    {key: statistics.median(values) for key, values in samples.items()},
+                    "")
                 
         except subprocess.TimeoutExpired:
-            return 10.0, "Execution timeout"
+            return timeout, {}, "Execution timeout"
         except Exception as e:
-            return 0.0, f"Execution error: {str(e)}"
+            return 0.0, {}, f"Execution error: {str(e)}"
     
-    def run_all_benchmarks(self) -> Dict[str, List[BenchmarkResult]]:
-        """Run all benchmark pairs and collect results."""
-        
-        benchmark_pairs = [
-            ("serialization_reflection.cpp", "serialization_traditional.cpp"),
-            ("orm_reflection.cpp", "orm_traditional.cpp"),
-            ("binding_reflection.cpp", "binding_traditional.cpp"),
-            ("pattern_reflection.cpp", "pattern_traditional.cpp"),
-            ("template_reflection.cpp", "template_traditional.cpp")
-        ]
-        
-        results = {}
+    @staticmethod
+    def _adaptive_timeout(history: List[float], floor: float) -> float:
+        """Five times the median of recent successful durations, never below `floor`."""
+        return max(floor, 5 * statistics.median(history)) if history else floor
+    
+    @staticmethod
+    def _record_time(history: List[float], seconds: float):
+        """Append a successful duration, keeping only the most recent samples."""
+        history.append(seconds)
+        del history[:-TIMING_HISTORY_LENGTH]
+    
+    def _stream_metrics(self, cmd: List[str], timeout: float) -> Tuple[int, Dict[str, float], str]:
+        """Run a benchmark binary, parsing `METRIC key=value` lines as they arrive.
         
-        for reflection_file, traditional_file in benchmark_pairs:
-            pair_name = reflection_file.replace("_reflection.cpp", "")
-            results[pair_name] = []
-            
-            print(f"\\n=== Benchmarking {pair_name} ===")
+        Only the parsed floats are kept, never the raw stdout. Returns
+        (returncode, metrics, stderr); raises TimeoutExpired past `timeout`.
+        """
+        metrics = {}
+        timed_out = threading.Event()
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              text=True) as proc:
+            self._pin(proc)
             
-            # Compile and run reflection version
-            reflection_result = self.compile_benchmark(reflection_file)
-            if reflection_result.success:
-                exec_time, output = self.run_benchmark(
-                    reflection_file.replace('.cpp', '.exe' if os.name == 'nt' else '')
-                )
-                reflection_result.execution_time = exec_time
-                reflection_result.output += "\\n" + output
+            def kill():
+                timed_out.set()
+                proc.kill()
             
-            results[pair_name].append(reflection_result)
+            # Drain stderr concurrently: a child that fills the stderr pipe
+            # while we are still reading stdout would otherwise block until
+            # the watchdog fires
+            stderr_chunks = []
+            drain = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()),
+                                     daemon=True)
+            drain.start()
             
-            # Compile and run traditional version  
-            traditional_result = self.compile_benchmark(traditional_file)
-            if traditional_result.success:
-                exec_time, output = self.run_benchmark(
-                    traditional_file.replace('.cpp', '.exe' if os.name == 'nt' else '')
-                )
-                traditional_result.execution_time = exec_time
-                traditional_result.output += "\\n" + output
-            
-            results[pair_name].append(traditional_result)
+            watchdog = threading.Timer(timeout, kill)
+            watchdog.start()
+            try:
+                for line in proc.stdout:
+                    if line.startswith("METRIC "):
+                        key, _, value = line[len("METRIC "):].partition("=")
+                        try:
+                            metrics[key.strip()] = float(value)
+                        except ValueError:
+                            pass
+                proc.wait()
+                drain.join()
+            finally:
+                watchdog.cancel()
+        stderr = "".join(stderr_chunks)
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return proc.returncode, metrics, stderr
+    
+    def _pin(self, proc: subprocess.Popen):
+        """Pin a benchmark process to the benchmark core and raise its priority.
+        
+        Best effort: raising priority usually needs privileges, and a failure
+        only costs measurement stability, never correctness.
+        """
+        if hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(proc.pid, {self._bench_cpu})
+            except OSError:
+                pass
+        if hasattr(os, "setpriority"):
+            try:
+                os.setpriority(os.PRIO_PROCESS, proc.pid, -10)
+            except OSError:
+                pass
+        if os.name == "nt":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetProcessAffinityMask(int(proc._handle), 1 << self._bench_cpu)
+            kernel32.SetPriorityClass(int(proc._handle), HIGH_PRIORITY_CLASS)
+    
+    def run_all_benchmarks(self, profiles: Tuple[str, ...] = ("speed", "size", "pgo")
+                           ) -> Dict[str, Dict[str, List[BenchmarkResult]]]:
+        """Run all benchmark pairs under each build profile and collect results.
+        
+        Results are keyed by profile, then by benchmark pair.
+        """
+        
+        # Phase 1: every compilation is an independent subprocess, so all of
+        # them run concurrently on one event loop (the work is in the compiler)
+        jobs = [(source, profile) for profile in profiles for source in BENCHMARK_FILES]
+        stats_before = self._ccache_stats()
+        pump_env = self._start_pump() if self.pump else {}
+        try:
+            compiled = dict(zip(jobs, asyncio.run(self._compile_jobs(jobs))))
+        finally:
+            if pump_env:
+                self._stop_pump(pump_env)
+        stats_after = self._ccache_stats()
+        
+        # Compiles overlap, so hits are attributed to the whole phase
+        self.ccache_stats = {
+            key: stats_after.get(key, 0) - stats_before.get(key, 0)
+            for key in ("direct_cache_hit", "preprocessed_cache_hit", "cache_miss")
+        } if self.launcher else {}
+        
+        # Phase 2: run the binaries one at a time so CPU contention from other
+        # benchmarks cannot perturb the execution time measurements
+        results = {profile: {} for profile in profiles}
+        
+        for profile in profiles:
+            for pair_name, (reflection_file, traditional_file) in zip(BENCHMARK_DOMAINS,
+                                                                       BENCHMARK_PAIRS):
+                results[profile][pair_name] = []
+                
+                print(f"\\n=== Benchmarking {pair_name} ({profile}) ===")
+                
+                # Run reflection version, then traditional version
+                for source_file in (reflection_file, traditional_file):
+                    result = compiled[(source_file, profile)]
+                    if result.success:
+                        exec_time, metrics, error = self.run_benchmark(
+                            self._exe_path(source_file, profile).name
+                        )
+                        result.execution_time = exec_time
+                        result.metrics = metrics
+                        if error:
+                            result.output += "\\n" + error
+                    
+                    results[profile][pair_name].append(result)
         
         return results
     
-    def analyze_results(self, results: Dict[str, List[BenchmarkResult]]) -> Dict:
-        """Analyze benchmark results and compute comparisons."""
+    async def _compile_jobs(self, jobs: List[Tuple[str, str]]) -> List[BenchmarkResult]:
+        """Compile (source, profile) jobs concurrently, at most max_workers at once."""
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def bounded(source_file: str, profile: str) -> BenchmarkResult:
+            async with semaphore:
+                return await self.compile_benchmark_async(source_file, profile=profile)
+        
+        return await asyncio.gather(*(bounded(*job) for job in jobs))
+    
+    def analyze_results(self, results: Dict[str, Dict[str, List[BenchmarkResult]]]) -> Dict:
+        """Analyze benchmark results and compute comparisons.
+        
+        The summary is keyed by pair, then by build profile.
+        """
         
         analysis = {
             "summary": {},
             "detailed_results": results,
-            "compiler_info": self.available_compilers
+            "compiler_info": self.available_compilers,
+            "ccache": self.ccache_stats
         }
         
-        for pair_name, pair_results in results.items():
-            if len(pair_results) >= 2:
-                reflection_result = pair_results[0]
-                traditional_result = pair_results[1]
-                
-                if reflection_result.success and traditional_result.success:
-                    # Calculate speedups and ratios
-                    compilation_speedup = (traditional_result.compilation_time / 
-                                         reflection_result.compilation_time 
-                                         if reflection_result.compilation_time > 0 else float('inf'))
-                    
-                    execution_speedup = (traditional_result.execution_time / 
-                                       reflection_result.execution_time 
-                                       if reflection_result.execution_time > 0 else float('inf'))
-                    
-                    size_ratio = (reflection_result.binary_size / 
-                                traditional_result.binary_size 
-                                if traditional_result.binary_size > 0 else float('inf'))
-                    
-                    analysis["summary"][pair_name] = {
-                        "compilation_speedup": compilation_speedup,
-                        "execution_speedup": execution_speedup,
-                        "size_ratio": size_ratio,
-                        "reflection_compile_time": reflection_result.compilation_time,
-                        "traditional_compile_time": traditional_result.compilation_time,
-                        "reflection_execution_time": reflection_result.execution_time,
-                        "traditional_execution_time": traditional_result.execution_time,
-                        "reflection_binary_size": reflection_result.binary_size,
-                        "traditional_binary_size": traditional_result.binary_size
-                    }
-                else:
-                    analysis["summary"][pair_name] = {
-                        "error": "One or both benchmarks failed",
-                        "reflection_success": reflection_result.success,
-                        "traditional_success": traditional_result.success
-                    }
+        for profile, profile_results in results.items():
+            for pair_name, pair_results in profile_results.items():
+                if len(pair_results) >= 2:
+                    analysis["summary"].setdefault(pair_name, {})[profile] = \
+                        self._compare_pair(pair_results[0], pair_results[1])
         
         return analysis
     
+    @staticmethod
+    def _compare_pair(reflection_result: BenchmarkResult,
+                      traditional_result: BenchmarkResult) -> Dict:
+        """Speedups and ratios of one reflection/traditional pair."""
+        
+        if not (reflection_result.success and traditional_result.success):
+            return {
+                "error": "One or both benchmarks failed",
+                "reflection_success": reflection_result.success,
+                "traditional_success": traditional_result.success
+            }
+        
+        # Calculate speedups and ratios
+        compilation_speedup = (traditional_result.compilation_time / 
+                             reflection_result.compilation_time 
+                             if reflection_result.compilation_time > 0 else float('inf'))
+        
+        execution_speedup = (traditional_result.execution_time / 
+                           reflection_result.execution_time 
+                           if reflection_result.execution_time > 0 else float('inf'))
+        
+        size_ratio = (reflection_result.binary_size / 
+                    traditional_result.binary_size 
+                    if traditional_result.binary_size > 0 else float('inf'))
+        
+        return {
+            "compilation_speedup": compilation_speedup,
+            "execution_speedup": execution_speedup,
+            "size_ratio": size_ratio,
+            "reflection_compile_time": reflection_result.compilation_time,
+            "traditional_compile_time": traditional_result.compilation_time,
+            "reflection_execution_time": reflection_result.execution_time,
+            "traditional_execution_time": traditional_result.execution_time,
+            "reflection_binary_size": reflection_result.binary_size,
+            "traditional_binary_size": traditional_result.binary_size
+        }
+    
+    def _start_pump(self) -> Dict[str, str]:
+        """Start the distcc pump include server for the compile phase.
+        
+        Returns the variables it exported (already applied to compile_env),
+        or an empty dict if it could not be started.
+        """
+        try:
+            result = subprocess.run(["pump", "--startup"], capture_output=True,
+                                  text=True, timeout=30, env=self.compile_env)
+        except (OSError, subprocess.TimeoutExpired):
+            return {}
+        if result.returncode != 0:
+            return {}
+        # pump prints `export NAME='value'` lines meant for a shell eval
+        pump_env = {}
+        for line in result.stdout.splitlines():
+            if line.startswith("export "):
+                name, _, value = line[len("export "):].partition("=")
+                pump_env[name] = "".join(shlex.split(value))
+        self.compile_env.update(pump_env)
+        return pump_env
+    
+    def _stop_pump(self, pump_env: Dict[str, str]):
+        """Shut down the include server started by _start_pump."""
+        try:
+            subprocess.run(["pump", "--shutdown"], capture_output=True,
+                         timeout=30, env=self.compile_env)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        for name in pump_env:
+            self.compile_env.pop(name, None)
+    
+    def _ccache_stats(self) -> Dict[str, int]:
+        """Snapshot the ccache counters (empty when ccache is not in use)."""
+        if not self.launcher:
+            return {}
+        try:
+            result = subprocess.run(["ccache", "--print-stats"], capture_output=True,
+                                  text=True, timeout=5, env=self.compile_env)
+        except (OSError, subprocess.TimeoutExpired):
+            return {}
+        stats = {}
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition("\t")
+            if value.isdigit():
+                stats[key] = int(value)
+        return stats
+    
     def save_results(self, analysis: Dict, filename: str = "benchmark_results.json"):
         """Save analysis results to JSON file."""
         
@@ -280,16 +808,28 @@ class BenchmarkRunner:
         serializable_analysis = {}
         for key, value in analysis.items():
             if key == "detailed_results":
-                serializable_analysis[key] = {}
-                for pair_name, pair_results in value.items():
-                    serializable_analysis[key][pair_name] = [
-                        asdict(result) for result in pair_results
-                    ]
+                serializable_analysis[key] = {
+                    profile: {
+                        pair_name: [result.as_dict() for result in pair_results]
+                        for pair_name, pair_results in profile_results.items()
+                    }
+                    for profile, profile_results in value.items()
+                }
             else:
                 serializable_analysis[key] = value
         
-        with open(results_file, 'w') as f:
-            json.dump(serializable_analysis, f, indent=2)
+        if orjson is not None:
+            with open(results_file, 'wb') as f:
+                f.write(orjson.dumps(serializable_analysis, option=orjson.OPT_INDENT_2))
+        else:
+            with open(results_file, 'w') as f:
+                json.dump(serializable_analysis, f, indent=2)
+        
+        self._compile_cache_path.write_text(json.dumps(self._compile_cache, indent=2))
+        self._timing_history_path.write_text(json.dumps({
+            "compile": {key: times for key, times in self._compile_time_history.items() if times},
+            "run": {key: times for key, times in self._run_time_history.items() if times}
+        }, indent=2))
         
         print(f"\\nResults saved to {results_file}")
     
@@ -310,37 +850,46 @@ class BenchmarkRunner:
         
         summary = analysis.get("summary", {})
         
-        for pair_name, metrics in summary.items():
-            print(f"📊 {pair_name.upper()} BENCHMARK:")
-            
-            if "error" in metrics:
-                print(f"   ❌ {metrics['error']}")
-                continue
-            
-            print(f"   Compilation Time:")
-            print(f"     Reflection: {metrics['reflection_compile_time']:.3f}s")
-            print(f"     Traditional: {metrics['traditional_compile_time']:.3f}s")
-            print(f"     Speedup: {metrics['compilation_speedup']:.2f}x")
-            
-            print(f"   Execution Time:")
-            print(f"     Reflection: {metrics['reflection_execution_time']:.3f}s")
-            print(f"     Traditional: {metrics['traditional_execution_time']:.3f}s")
-            print(f"     Speedup: {metrics['execution_speedup']:.2f}x")
-            
-            print(f"   Binary Size:")
-            print(f"     Reflection: {metrics['reflection_binary_size']:,} bytes")
-            print(f"     Traditional: {metrics['traditional_binary_size']:,} bytes") 
-            print(f"     Size Ratio: {metrics['size_ratio']:.2f}x")
-            print("")
+        for pair_name, profiles in summary.items():
+            for profile, metrics in profiles.items():
+                print(f"📊 {pair_name.upper()} BENCHMARK ({profile}):")
+                
+                if "error" in metrics:
+                    print(f"   ❌ {metrics['error']}")
+                    continue
+                
+                print(f"   Compilation Time:")
+                print(f"     Reflection: {metrics['reflection_compile_time']:.3f}s")
+                print(f"     Traditional: {metrics['traditional_compile_time']:.3f}s")
+                print(f"     Speedup: {metrics['compilation_speedup']:.2f}x")
+                
+                print(f"   Execution Time:")
+                print(f"     Reflection: {metrics['reflection_execution_time']:.3f}s")
+                print(f"     Traditional: {metrics['traditional_execution_time']:.3f}s")
+                print(f"     Speedup: {metrics['execution_speedup']:.2f}x")
+                
+                print(f"   Binary Size:")
+                print(f"     Reflection: {metrics['reflection_binary_size']:,} bytes")
+                print(f"     Traditional: {metrics['traditional_binary_size']:,} bytes") 
+                print(f"     Size Ratio: {metrics['size_ratio']:.2f}x")
+                print("")
 
 def main():
     """Main function to run all benchmarks and generate results."""
     
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fresh", action="store_true",
+                        help="bypass cached compiles (for the official compilation_time run)")
+    parser.add_argument("--pump", action="store_true",
+                        help="use distcc pump mode when DISTCC_HOSTS is set")
+    args = parser.parse_args()
+    
     print("🚀 C++23 Reflection vs Traditional Approaches Benchmark")
     print("=" * 60)
     
     # Initialize benchmark runner
-    runner = BenchmarkRunner("C:/Users/P - K/Downloads/cpp prop/reflection_metaclasses_paper/implementation")
+    runner = BenchmarkRunner("C:/Users/P - K/Downloads/cpp prop/reflection_metaclasses_paper/implementation",
+                             fresh=args.fresh, pump=args.pump)
     
     if not runner.available_compilers:
         print("❌ No C++ compilers found. Please install GCC, Clang, or MSVC.")
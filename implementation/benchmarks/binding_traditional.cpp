@@ -1,9 +1,30 @@
-
 #include <iostream>
 #include <string>
 #include <vector>
 #include <chrono>
 #include <functional>
+// std::format where the standard library ships it, header-only {fmt} otherwise
+#if __has_include(<format>)
+#include <format>
+#endif
+#if defined(__cpp_lib_format)
+namespace fmtlib = std;
+#else
+#define FMT_HEADER_ONLY
+#include <fmt/format.h>
+namespace fmtlib = fmt;
+#endif
+
+// Machine-readable result lines parsed by the Python drivers: `METRIC key=value`
+// lines for the runner, then a JSON summary that must stay the last line
+inline void emit_json(const char* name, std::chrono::nanoseconds elapsed, double operations) {
+    const long long duration_ns = elapsed.count();
+    const long long duration_us = duration_ns / 1000;
+    const double ops_per_s = duration_ns > 0 ? operations * 1e9 / duration_ns : 0.0;
+    std::cout << fmtlib::format("METRIC bench_ns={}\nMETRIC ops_per_s={}\n", duration_ns, ops_per_s);
+    std::cout << fmtlib::format("{{\"name\":\"{}\",\"duration_us\":{},\"ops_per_s\":{}}}\n",
+                                name, duration_us, ops_per_s);
+}
 
 // Traditional property binding implementation
 class DataModel {
@@ -83,10 +104,8 @@ void benchmark_binding_traditional() {
     }
     
     auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
     
-    std::cout << "Binding Traditional: " << duration.count() << " microseconds\n";
-    std::cout << "Property updates per second: " << (iterations * 3 * 1000000.0) / duration.count() << "\n";
+    emit_json("binding_traditional", end - start, iterations * 3);
 }
 
 int main() {
@@ -1,13 +1,44 @@
-
 #include <iostream>
 #include <string>
 #include <vector>
 #include <chrono>
 #include <map>
+#include <iterator>
+#include <string_view>
+// std::format where the standard library ships it, header-only {fmt} otherwise
+#if __has_include(<format>)
+#include <format>
+#endif
+#if defined(__cpp_lib_format)
+namespace fmtlib = std;
+#else
+#define FMT_HEADER_ONLY
+#include <fmt/format.h>
+namespace fmtlib = fmt;
+#endif
+
+// Machine-readable result lines parsed by the Python drivers: `METRIC key=value`
+// lines for the runner, then a JSON summary that must stay the last line
+inline void emit_json(const char* name, std::chrono::nanoseconds elapsed, double operations) {
+    const long long duration_ns = elapsed.count();
+    const long long duration_us = duration_ns / 1000;
+    const double ops_per_s = duration_ns > 0 ? operations * 1e9 / duration_ns : 0.0;
+    std::cout << fmtlib::format("METRIC bench_ns={}\nMETRIC ops_per_s={}\n", duration_ns, ops_per_s);
+    std::cout << fmtlib::format("{{\"name\":\"{}\",\"duration_us\":{},\"ops_per_s\":{}}}\n",
+                                name, duration_us, ops_per_s);
+}
 
 // Simulated ORM with reflection
 class $entity User {
 public:
+    // Fixed statement shapes, parsed once at compile time
+    static constexpr std::string_view INSERT_SQL =
+        "INSERT INTO users (id, username, email, age) VALUES ({}, '{}', '{}', {})";
+    static constexpr std::string_view UPDATE_SQL =
+        "UPDATE users SET username='{}', email='{}', age={} WHERE id={}";
+    static constexpr std::string_view SELECT_ALL_SQL =
+        "SELECT id, username, email, age FROM users";
+    
     int id;
     std::string username;
     std::string email;
@@ -15,18 +46,23 @@ public:
     
     // Generated SQL methods (simulated)
     std::string to_insert_sql() const {
-        return "INSERT INTO users (id, username, email, age) VALUES (" +
-               std::to_string(id) + ", '" + username + "', '" + email + "', " +
-               std::to_string(age) + ")";
+        std::string sql;
+        to_insert_sql(sql);
+        return sql;
+    }
+    
+    // Appends to a caller-owned buffer so hot loops can reuse its capacity
+    void to_insert_sql(std::string& out) const {
+        fmtlib::format_to(std::back_inserter(out), INSERT_SQL,
+                          id, username, email, age);
     }
     
     std::string to_update_sql() const {
-        return "UPDATE users SET username='" + username + "', email='" + email +
-               "', age=" + std::to_string(age) + " WHERE id=" + std::to_string(id);
+        return fmtlib::format(UPDATE_SQL, username, email, age, id);
     }
     
-    static std::string select_all_sql() {
-        return "SELECT id, username, email, age FROM users";
+    static constexpr std::string_view select_all_sql() {
+        return SELECT_ALL_SQL;
     }
 };
 
@@ -50,15 +86,17 @@ void benchmark_orm_reflection() {
     // Generate SQL statements
     std::vector<std::string> sql_statements;
     sql_statements.reserve(iterations);
+    std::string buf;
+    buf.reserve(128);
     for (const auto& user : users) {
-        sql_statements.push_back(user.to_insert_sql());
+        buf.clear();
+        user.to_insert_sql(buf);
+        sql_statements.emplace_back(buf);
     }
     
     auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
     
-    std::cout << "ORM Reflection: " << duration.count() << " microseconds\n";
-    std::cout << "SQL generations per second: " << (iterations * 1000000.0) / duration.count() << "\n";
+    emit_json("orm_reflection", end - start, iterations);
 }
 
 int main() {
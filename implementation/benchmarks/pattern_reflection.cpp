@@ -1,9 +1,31 @@
-
 #include <iostream>
 #include <string>
 #include <vector>
 #include <chrono>
 #include <memory>
+#include <iterator>
+// std::format where the standard library ships it, header-only {fmt} otherwise
+#if __has_include(<format>)
+#include <format>
+#endif
+#if defined(__cpp_lib_format)
+namespace fmtlib = std;
+#else
+#define FMT_HEADER_ONLY
+#include <fmt/format.h>
+namespace fmtlib = fmt;
+#endif
+
+// Machine-readable result lines parsed by the Python drivers: `METRIC key=value`
+// lines for the runner, then a JSON summary that must stay the last line
+inline void emit_json(const char* name, std::chrono::nanoseconds elapsed, double operations) {
+    const long long duration_ns = elapsed.count();
+    const long long duration_us = duration_ns / 1000;
+    const double ops_per_s = duration_ns > 0 ? operations * 1e9 / duration_ns : 0.0;
+    std::cout << fmtlib::format("METRIC bench_ns={}\nMETRIC ops_per_s={}\n", duration_ns, ops_per_s);
+    std::cout << fmtlib::format("{{\"name\":\"{}\",\"duration_us\":{},\"ops_per_s\":{}}}\n",
+                                name, duration_us, ops_per_s);
+}
 
 // Observer pattern with reflection
 class $observable Subject {
@@ -59,15 +81,17 @@ void benchmark_pattern_reflection() {
     auto start = std::chrono::high_resolution_clock::now();
     
     // Trigger state changes
+    std::string buf;
+    buf.reserve(32);
     for (int i = 0; i < iterations; ++i) {
-        subjects[i].set_state("State" + std::to_string(i));
+        buf.clear();
+        fmtlib::format_to(std::back_inserter(buf), "State{}", i);
+        subjects[i].set_state(buf);
     }
     
     auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
     
-    std::cout << "Pattern Reflection: " << duration.count() << " microseconds\n";
-    std::cout << "Notifications per second: " << (iterations * observers_per_subject * 1000000.0) / duration.count() << "\n";
+    emit_json("pattern_reflection", end - start, iterations * observers_per_subject);
 }
 
 int main() {
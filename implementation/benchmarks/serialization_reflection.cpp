@@ -1,9 +1,31 @@
-
 #include <iostream>
 #include <string>
 #include <vector>
 #include <chrono>
-#include <sstream>
+#include <iterator>
+#include <string_view>
+// std::format where the standard library ships it, header-only {fmt} otherwise
+#if __has_include(<format>)
+#include <format>
+#endif
+#if defined(__cpp_lib_format)
+namespace fmtlib = std;
+#else
+#define FMT_HEADER_ONLY
+#include <fmt/format.h>
+namespace fmtlib = fmt;
+#endif
+
+// Machine-readable result lines parsed by the Python drivers: `METRIC key=value`
+// lines for the runner, then a JSON summary that must stay the last line
+inline void emit_json(const char* name, std::chrono::nanoseconds elapsed, double operations) {
+    const long long duration_ns = elapsed.count();
+    const long long duration_us = duration_ns / 1000;
+    const double ops_per_s = duration_ns > 0 ? operations * 1e9 / duration_ns : 0.0;
+    std::cout << fmtlib::format("METRIC bench_ns={}\nMETRIC ops_per_s={}\n", duration_ns, ops_per_s);
+    std::cout << fmtlib::format("{{\"name\":\"{}\",\"duration_us\":{},\"ops_per_s\":{}}}\n",
+                                name, duration_us, ops_per_s);
+}
 
 // Simulated C++23 reflection (using placeholder implementation)
 namespace std::meta {
@@ -18,17 +40,24 @@ namespace std::meta {
 
 class $serializable Person {
 public:
+    // Fixed document shape, parsed once at compile time
+    static constexpr std::string_view JSON_FORMAT =
+        R"({{"name":"{}","age":{},"email":"{}"}})";
+    
     std::string name;
     int age;
     std::string email;
     
     // Generated serialization (simulated)
     std::string to_json() const {
-        std::ostringstream oss;
-        oss << "{\"name\":\"" << name << "\",";
-        oss << "\"age\":" << age << ",";
-        oss << "\"email\":\"" << email << "\"}";
-        return oss.str();
+        std::string json;
+        to_json(json);
+        return json;
+    }
+    
+    // Appends to a caller-owned buffer so hot loops can reuse its capacity
+    void to_json(std::string& out) const {
+        fmtlib::format_to(std::back_inserter(out), JSON_FORMAT, name, age, email);
     }
     
     void from_json(const std::string& json) {
@@ -58,15 +87,17 @@ void benchmark_reflection_serialization() {
     // Serialize all objects
     std::vector<std::string> serialized;
     serialized.reserve(iterations);
+    std::string buf;
+    buf.reserve(128);
     for (const auto& person : people) {
-        serialized.push_back(person.to_json());
+        buf.clear();
+        person.to_json(buf);
+        serialized.emplace_back(buf);
     }
     
     auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
     
-    std::cout << "Reflection serialization: " << duration.count() << " microseconds\n";
-    std::cout << "Operations per second: " << (iterations * 1000000.0) / duration.count() << "\n";
+    emit_json("serialization_reflection", end - start, iterations);
 }
 
 int main() {
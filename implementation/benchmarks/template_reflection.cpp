@@ -1,9 +1,37 @@
-
 #include <iostream>
 #include <string>
 #include <vector>
 #include <chrono>
+#include <string_view>
 #include <type_traits>
+// std::format where the standard library ships it, header-only {fmt} otherwise
+#if __has_include(<format>)
+#include <format>
+#endif
+#if defined(__cpp_lib_format)
+namespace fmtlib = std;
+#else
+#define FMT_HEADER_ONLY
+#include <fmt/format.h>
+namespace fmtlib = fmt;
+#endif
+
+// Machine-readable result lines parsed by the Python drivers: `METRIC key=value`
+// lines for the runner, then a JSON summary that must stay the last line
+inline void emit_json(const char* name, std::chrono::nanoseconds elapsed, double operations) {
+    const long long duration_ns = elapsed.count();
+    const long long duration_us = duration_ns / 1000;
+    const double ops_per_s = duration_ns > 0 ? operations * 1e9 / duration_ns : 0.0;
+    std::cout << fmtlib::format("METRIC bench_ns={}\nMETRIC ops_per_s={}\n", duration_ns, ops_per_s);
+    std::cout << fmtlib::format("{{\"name\":\"{}\",\"duration_us\":{},\"ops_per_s\":{}}}\n",
+                                name, duration_us, ops_per_s);
+}
+
+// Element type names resolved at compile time
+template<typename T> constexpr std::string_view type_name_v = "unknown";
+template<> constexpr std::string_view type_name_v<int> = "int";
+template<> constexpr std::string_view type_name_v<double> = "double";
+template<> constexpr std::string_view type_name_v<std::string> = "std::string";
 
 // Complex template hierarchy with reflection
 template<typename T>
@@ -11,6 +39,8 @@ class $reflectable Container {
 private:
     std::vector<T> data_;
     
+    static constexpr std::string_view TYPE_NAME = type_name_v<T>;
+    
 public:
     void add(const T& item) { data_.push_back(item); }
     
@@ -18,21 +48,23 @@ public:
     
     // Generated introspection methods
     static std::string get_type_name() {
-        return "Container<" + get_element_type_name() + ">";
+        return std::string("Container<").append(TYPE_NAME).append(">");
     }
     
-    static std::string get_element_type_name() {
-        return typeid(T).name();
+    static constexpr std::string_view get_element_type_name() {
+        return TYPE_NAME;
     }
     
     // Generated serialization
     std::string serialize() const {
-        std::string result = "[";
+        std::string result;
+        result.reserve(data_.size() * 16);
+        result += '[';
         for (size_t i = 0; i < data_.size(); ++i) {
-            if (i > 0) result += ",";
+            if (i > 0) result += ',';
             result += serialize_element(data_[i]);
         }
-        result += "]";
+        result += ']';
         return result;
     }
     
@@ -41,7 +73,7 @@ private:
         if constexpr (std::is_arithmetic_v<T>) {
             return std::to_string(element);
         } else {
-            return """ + std::string(element) + """;
+            return '"' + std::string(element) + '"';
         }
     }
 };
@@ -69,10 +101,8 @@ void benchmark_template_reflection() {
     }
     
     auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
     
-    std::cout << "Template Reflection: " << duration.count() << " microseconds\n";
-    std::cout << "Operations per second: " << (iterations * 1000000.0) / duration.count() << "\n";
+    emit_json("template_reflection", end - start, iterations);
 }
 
 int main() {
@@ -1,10 +1,31 @@
-
 #include <iostream>
 #include <string>
 #include <vector>
 #include <chrono>
 #include <type_traits>
 #include <sstream>
+// std::format where the standard library ships it, header-only {fmt} otherwise
+#if __has_include(<format>)
+#include <format>
+#endif
+#if defined(__cpp_lib_format)
+namespace fmtlib = std;
+#else
+#define FMT_HEADER_ONLY
+#include <fmt/format.h>
+namespace fmtlib = fmt;
+#endif
+
+// Machine-readable result lines parsed by the Python drivers: `METRIC key=value`
+// lines for the runner, then a JSON summary that must stay the last line
+inline void emit_json(const char* name, std::chrono::nanoseconds elapsed, double operations) {
+    const long long duration_ns = elapsed.count();
+    const long long duration_us = duration_ns / 1000;
+    const double ops_per_s = duration_ns > 0 ? operations * 1e9 / duration_ns : 0.0;
+    std::cout << fmtlib::format("METRIC bench_ns={}\nMETRIC ops_per_s={}\n", duration_ns, ops_per_s);
+    std::cout << fmtlib::format("{{\"name\":\"{}\",\"duration_us\":{},\"ops_per_s\":{}}}\n",
+                                name, duration_us, ops_per_s);
+}
 
 // Traditional complex template hierarchy
 template<typename T>
@@ -37,7 +58,7 @@ private:
         if constexpr (std::is_arithmetic_v<T>) {
             oss << element;
         } else {
-            oss << """ << element << """;
+            oss << '"' << element << '"';
         }
     }
 };
@@ -62,7 +83,7 @@ public:
         oss << "[";
         for (size_t i = 0; i < data_.size(); ++i) {
             if (i > 0) oss << ",";
-            oss << """ << data_[i] << """;
+            oss << '"' << data_[i] << '"';
         }
         oss << "]";
         return oss.str();
@@ -92,10 +113,8 @@ void benchmark_template_traditional() {
     }
     
     auto end = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end - start);
     
-    std::cout << "Template Traditional: " << duration.count() << " microseconds\n";
-    std::cout << "Operations per second: " << (iterations * 1000000.0) / duration.count() << "\n";
+    emit_json("template_traditional", end - start, iterations);
 }
 
 int main() {